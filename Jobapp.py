@@ -1,53 +1,2333 @@
 #!/usr/bin/env python3
 import tkinter as tk
 from tkinter import ttk, messagebox
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, date
+from functools import lru_cache, partial, wraps
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from operator import attrgetter, itemgetter
+from urllib.parse import parse_qs, urlsplit
+from array import array
+import argparse
 import json
+import queue
+import csv
+import html
+import sqlite3
+import struct
+import gc
+import hashlib
+import heapq
+import zlib
 import os
+import re
 import threading
 import time
-import webbrowser
 import random
 import math
 import sys
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+from bisect import bisect_left, bisect_right, insort
+from itertools import islice
 
 # ==============================
-# SINGLE INSTANCE LOCK
+# FILE PATHS
 # ==============================
-LOCK_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "jobtracker.lock")
+def set_app_dir(path):
+    """Point every data file at `path`; the benchmarks use this to stay off real data."""
+    global APP_DIR, DATA_FILE, MANIFEST_FILE, JOURNAL_FILE, META_FILE, DB_FILE, TYPES_FILE, BACKUP_DIR, MILESTONE_FILE, SETTINGS_FILE
+    global LOCK_FILE, GENERATION_FILE, UNDO_FILE
+    APP_DIR = path
+    # Single-file snapshot from before month shards; migrated on first load
+    DATA_FILE = os.path.join(APP_DIR, "applications.json")
+    MANIFEST_FILE = os.path.join(APP_DIR, "applications.manifest.json")
+    JOURNAL_FILE = os.path.join(APP_DIR, "applications.journal")
+    META_FILE = os.path.join(APP_DIR, "applications.meta.json")
+    DB_FILE = os.path.join(APP_DIR, "applications.db")
+    TYPES_FILE = os.path.join(APP_DIR, "job_types.json")
+    BACKUP_DIR = os.path.join(APP_DIR, "backups")
+    MILESTONE_FILE = os.path.join(APP_DIR, "milestones.json")
+    SETTINGS_FILE = os.path.join(APP_DIR, "settings.json")
+    LOCK_FILE = os.path.join(APP_DIR, "jobtracker.lock")
+    GENERATION_FILE = os.path.join(APP_DIR, "jobtracker.generation")
+    UNDO_FILE = os.path.join(APP_DIR, "undo.jsonl")
+    os.makedirs(BACKUP_DIR, exist_ok=True)
 
-def acquire_lock():
-    try:
-        if os.path.exists(LOCK_FILE):
-            os.remove(LOCK_FILE)
-    except OSError:
-        pass
+set_app_dir(os.path.join(os.path.expanduser("~"), ".jobtracker"))
+
+# How long a commit waits on another process's lock before saying whose it is
+LOCK_WARN_S = 5
+# How soon the Tk thread tries again when the lock is busy; it never waits on it
+LOCK_RETRY_MS = 100
+# How often the app looks for commits made by other processes: every
+# WATCH_INTERVAL_S after a change, backing off to WATCH_MAX_INTERVAL_S while
+# nothing changes, and right away when the window gets focus
+WATCH_INTERVAL_S = 1
+WATCH_MAX_INTERVAL_S = 60
+# Rows of the SQLite change log kept for other processes to catch up from
+CHANGE_LOG_KEEP = 1000
+# How long an API request waits for a snapshot of the latest data
+API_SNAPSHOT_WAIT_S = 2
+# Edits that Ctrl+Z can take back
+UNDO_KEEP = 100
+
+# Number of journaled mutations after which the dirty shards are rewritten
+JOURNAL_COMPACT_THRESHOLD = 200
+# Longest time between backup points while there are changes to back up
+BACKUP_INTERVAL_S = 3600
+# How long the journal writer waits to gather a burst into one write
+JOURNAL_COALESCE_MS = 50
+
+# Rows kept in the Treeview below the visible window
+VIEW_OVERSCAN = 5
+
+# Longest single root.after sleep; bounds the lag after a suspend or clock change
+SCHEDULER_MAX_SLEEP_S = 900
+# Canvas ovals shared by all celebration particles, and the frame interval
+FIREWORK_POOL_SIZE = 2000
+FIREWORK_FRAME_MS = 30
+# Rows per page of an HTML export, and rows between progress updates
+EXPORT_PAGE_ROWS = 2000
+EXPORT_PROGRESS_EVERY = 500
+# Recent timings kept per instrumented section
+PERF_WINDOW = 200
+# Newest records shown before the full load finishes, and records parsed
+# between progress updates while it runs (single-file snapshots only; month
+# shards are read whole)
+STARTUP_PREVIEW_RECORDS = 500
+LOAD_CHUNK_RECORDS = 5000
+# Rows an import parses, reserves ids for and commits at a time
+IMPORT_CHUNK_RECORDS = 10000
+
+# ==============================
+# INSTRUMENTATION
+# ==============================
+class Perf:
+    """Timings of named hot-path sections, for finding out where the UI hitches.
+
+    Off unless JOBTRACKER_PERF is set ("profile" also runs cProfile) or it
+    is toggled with F12. While off, timed() wrappers cost one flag check
+    and section() hands back a shared no-op context. Sections are recorded
+    from any thread; readers copy the deques, which is atomic.
+    """
+
+    NULL = nullcontext()
+
+    def __init__(self, mode=""):
+        self.enabled = bool(mode)
+        self.samples = {}
+        self.counts = {}
+        self.profiler = None
+        if mode == "profile":
+            import cProfile
+            self.profiler = cProfile.Profile()
+            self.profiler.enable()
+
+    def record(self, name, elapsed):
+        self.samples.setdefault(name, deque(maxlen=PERF_WINDOW)).append(elapsed)
+        self.counts[name] = self.counts.get(name, 0) + 1
+
+    @contextmanager
+    def _section(self, name):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - started)
+
+    def section(self, name):
+        return self._section(name) if self.enabled else self.NULL
+
+    def timed(self, name):
+        def decorate(fn):
+            @wraps(fn)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return fn(*args, **kwargs)
+                started = time.perf_counter()
+                try:
+                    return fn(*args, **kwargs)
+                finally:
+                    self.record(name, time.perf_counter() - started)
+            return wrapper
+        return decorate
+
+    def summary(self):
+        """Return {section: {count, last, avg, p95}} in seconds over the recent window."""
+        summary = {}
+        for name, samples in list(self.samples.items()):
+            samples = samples.copy()
+            ordered = sorted(samples)
+            summary[name] = {
+                "count": self.counts.get(name, len(samples)),
+                "last": samples[-1],
+                "avg": sum(samples) / len(samples),
+                "p95": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+            }
+        return summary
+
+    def overlay(self):
+        return "   ".join(
+            f"{name} {s['last'] * 1000:.1f}/{s['avg'] * 1000:.1f}/{s['p95'] * 1000:.1f}"
+            for name, s in sorted(self.summary().items())
+        )
+
+    def dump(self, path):
+        """Write the summary and raw samples as JSON, plus a .prof next to it when profiling."""
+        trace = {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "window": PERF_WINDOW,
+            "summary": self.summary(),
+            "samples": {name: list(samples.copy()) for name, samples in list(self.samples.items())},
+        }
+        write_json_atomic(path, trace, indent=2)
+        if self.profiler is not None:
+            self.profiler.dump_stats(os.path.splitext(path)[0] + ".prof")
+        return path
+
+perf = Perf(os.environ.get("JOBTRACKER_PERF", "").strip().lower())
+
+# ==============================
+# DATA LOCK
+# ==============================
+class DataLock:
+    """Advisory lock serializing commits to the data directory across processes.
+
+    It is held only while something is written, so the app and command-line
+    runs can share the data. flock() on jobtracker.lock (a locked byte on
+    Windows) is dropped by the OS when its holder dies. The holder writes
+    its PID into the file and clears it on release, so a PID found there on
+    acquiring belongs to a process that died mid-commit; it is kept in
+    `stale` until the journal has cut off whatever that process left half
+    written. Threads of this process take `owner` first, which also makes
+    the lock reentrant.
+
+    Each commit bumps the counters in jobtracker.generation (replaced
+    atomically): "generation" on every commit and "compactions" whenever
+    shards are rewritten. Another process notices commits with one stat().
+    The same file holds "next_id", so processes never hand out the same
+    record id; reserve_ids() takes a whole block of them under one short
+    hold of the lock, which is how an import gets its ids.
+    """
+
+    def __init__(self, path, generation_path):
+        self.path = path
+        self.generation_path = generation_path
+        self.owner = threading.RLock()
+        self.depth = 0
+        self.fd = None
+        self.stale = None
+        self.next_id = None
+
+    def acquire(self, blocking=True):
+        if not self.owner.acquire(blocking):
+            return False
+        try:
+            if self.depth == 0 and not self._lock(blocking):
+                self.owner.release()
+                return False
+        except BaseException:
+            self.owner.release()
+            raise
+        self.depth += 1
+        return True
+
+    def release(self):
+        self.depth -= 1
+        if self.depth == 0:
+            if self.next_id is not None:
+                state = self.state()
+                state["next_id"] = max(state.get("next_id", 1), self.next_id)
+                self.save_state(state)
+                self.next_id = None
+            os.ftruncate(self.fd, 0)
+            if fcntl is not None:
+                fcntl.flock(self.fd, fcntl.LOCK_UN)
+            else:
+                os.lseek(self.fd, 0, os.SEEK_SET)
+                msvcrt.locking(self.fd, msvcrt.LK_UNLCK, 1)
+        self.owner.release()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
+
+    def _lock(self, blocking):
+        if self.fd is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self.fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        warn_at = time.monotonic() + LOCK_WARN_S
+        while True:
+            try:
+                if fcntl is not None:
+                    fcntl.flock(self.fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                else:
+                    os.lseek(self.fd, 0, os.SEEK_SET)
+                    msvcrt.locking(self.fd, msvcrt.LK_NBLCK, 1)
+                break
+            except OSError:
+                if not blocking:
+                    return False
+                if warn_at is not None and time.monotonic() > warn_at:
+                    warn_at = None
+                    print(f"[JobTracker] Waiting for process {self.holder() or '?'} to finish writing",
+                          file=sys.stderr)
+                time.sleep(0.01)
+        holder = self.holder()
+        if holder and holder != os.getpid():
+            print(f"[JobTracker] Process {holder} died while writing; recovering", file=sys.stderr)
+            self.stale = holder
+        os.ftruncate(self.fd, 0)
+        os.lseek(self.fd, 0, os.SEEK_SET)
+        os.write(self.fd, str(os.getpid()).encode())
+        return True
+
+    def holder(self):
+        try:
+            os.lseek(self.fd, 0, os.SEEK_SET)
+            return int(os.read(self.fd, 32) or 0)
+        except (OSError, ValueError):
+            return None
+
+    def signature(self):
+        """Cheap fingerprint of the counters file; it changes with every commit."""
+        try:
+            st = os.stat(self.generation_path)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size, st.st_ino
+
+    def state(self):
+        try:
+            with open(self.generation_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def save_state(self, state):
+        tmp = self.generation_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp, self.generation_path)
+
+    def counters(self):
+        """(generation, compactions) as of the last commit; (0, 0) before the first."""
+        state = self.state()
+        return state.get("generation", 0), state.get("compactions", 0)
+
+    def commit(self, compacted=False):
+        """Bump the counters; call with the lock held. Returns (before, after)."""
+        state = self.state()
+        before = (state.get("generation", 0), state.get("compactions", 0))
+        after = (before[0] + 1, before[1] + compacted)
+        state["generation"], state["compactions"] = after
+        self.save_state(state)
+        return before, after
+
+    def busy(self):
+        """Whether another thread or process holds the lock at the moment."""
+        if not self.acquire(blocking=False):
+            return True
+        self.release()
+        return False
+
+    def reserve_ids(self, count, floor, blocking=True):
+        """The first of `count` consecutive record ids no other process has
+        handed out, all at least `floor`. None, without waiting, if
+        `blocking` is false and someone else holds the lock."""
+        if not self.acquire(blocking):
+            return None
+        try:
+            if self.next_id is None:
+                self.next_id = self.state().get("next_id", 1)
+            first = max(self.next_id, floor)
+            self.next_id = first + count
+        finally:
+            self.release()
+        return first
+
+data_lock = DataLock(LOCK_FILE, GENERATION_FILE)
+
+# ==============================
+# JOURNAL
+# ==============================
+class Journal:
+    """Append-only log of record mutations on top of the month shards.
+
+    Each line is one compact JSON op: {"op": "put", "rec": {...}} or
+    {"op": "del", "id": n}. Ops carry the full record, so replaying a prefix
+    that is already part of the shards is harmless. A "shard" key names the
+    month whose shard still holds the record, when that is not the month
+    of its apply date, so replay knows which shard to read first.
+
+    put/delete/compact only queue work for a writer thread. The writer
+    gathers whatever arrives within JOURNAL_COALESCE_MS into one append and
+    one fsync, keeping only the last op per id, and runs compactions in
+    queue order, so a snapshot covers exactly the ops written before it.
+
+    Other processes append to the same file under data_lock. `generation`,
+    `compactions` and `offset` say how much of it this process has seen:
+    its own appends advance them only while nobody else has committed in
+    between, and JsonStorage.sync() catches up on the rest.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.queue = queue.Queue()
+        self.thread = None
+        self.pending = 0
+        self.max_id = 0
+        self.compact_queued = False
+        self.on_error = None
+        self.generation = 0
+        self.compactions = 0
+        self.offset = 0
+        self.seen = None
+
+    def scan(self):
+        """Return every op in the journal and count them as pending.
+
+        A torn tail is cut off if data_lock is free. If someone else holds
+        it, the journal is read as it stands instead of waiting: a line
+        being appended is simply not read yet, and the counters are read
+        first, so sync() picks up whatever lands meanwhile.
+        """
+        locked = data_lock.acquire(blocking=False)
+        try:
+            self.seen = data_lock.signature()
+            self.generation, self.compactions = data_lock.counters()
+            if locked:
+                data_lock.stale = None
+            ops, self.offset = self.read_from(0, repair=locked)
+        finally:
+            if locked:
+                data_lock.release()
+        self.pending = len(ops)
+        return ops
+
+    def read_from(self, offset, repair=False):
+        """Return (ops after byte `offset`, offset of the end of the last whole op).
+
+        A line that does not parse is a torn tail from a crash mid-append;
+        with `repair` (and data_lock held) it is cut off.
+        """
+        if not os.path.exists(self.path):
+            return [], 0
+        ops = []
+        good_end = offset
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            for line in f:
+                try:
+                    op = json.loads(line.decode("utf-8"))
+                except ValueError:
+                    break
+                if op.get("op") == "put":
+                    self.max_id = max(self.max_id, op["rec"]["id"])
+                ops.append(op)
+                good_end += len(line)
+        if repair and good_end < os.path.getsize(self.path):
+            with open(self.path, "r+b") as f:
+                f.truncate(good_end)
+        return ops, good_end
+
+    def changed(self):
+        """Whether another process has committed since this one last looked: one stat() when not."""
+        signature = data_lock.signature()
+        if signature == self.seen:
+            return False
+        if data_lock.counters() == (self.generation, self.compactions):
+            self.seen = signature
+            return False
+        return True
+
+    def replay(self, data):
+        records = {x["id"]: x for x in data}
+        for op in self.scan():
+            if op.get("op") == "put":
+                records[op["rec"]["id"]] = op["rec"]
+            elif op.get("op") == "del":
+                records.pop(op["id"], None)
+        return list(records.values())
+
+    def read_ops(self):
+        return self.read_from(0)[0]
+
+    def take_over(self):
+        """Count everything committed so far as seen; call with data_lock held."""
+        self.seen = data_lock.signature()
+        self.generation, self.compactions = data_lock.counters()
+        self.offset = os.path.getsize(self.path) if os.path.exists(self.path) else 0
+
+    def submit(self, kind, payload):
+        if self.thread is None or not self.thread.is_alive():
+            self.thread = threading.Thread(target=self.run, daemon=True)
+            self.thread.start()
+        self.queue.put((kind, payload))
+
+    def put(self, record, shard=None):
+        self.pending += 1
+        op = {"op": "put", "rec": record}
+        if shard:
+            op["shard"] = shard
+        self.submit("op", op)
+
+    def delete(self, app_id, shard=None):
+        self.pending += 1
+        op = {"op": "del", "id": app_id}
+        if shard:
+            op["shard"] = shard
+        self.submit("op", op)
+
+    def idle(self):
+        """Whether everything queued so far has been written (or has failed)."""
+        return self.queue.unfinished_tasks == 0
+
+    def needs_compaction(self):
+        return self.pending >= JOURNAL_COMPACT_THRESHOLD and not self.compact_queued
+
+    def compact(self, write, background=True, backup=False):
+        """Fold the journal into freshly written data files.
+
+        write() runs on the writer thread once every op queued before this
+        call is on disk, and returns (record count, a function returning
+        every record as a dict). With `backup`, those make a backup point;
+        otherwise the folded ops are kept for the next one. Records it
+        serializes that change after this call are also rewritten by their
+        own queued op, which lands in the journal after the compaction.
+        """
+        self.compact_queued = True
+        self.pending = 0
+        if background:
+            self.submit("compact", (write, backup))
+        else:
+            # Inline, so a caller already holding data_lock cannot deadlock
+            # against the writer thread waiting for it
+            self.flush()
+            self.write_compaction(write, backup)
+
+    def flush(self):
+        """Block until everything queued so far is on disk."""
+        if self.thread is None:
+            return
+        done = threading.Event()
+        self.submit("barrier", done)
+        done.wait()
+
+    def report(self, message):
+        if self.on_error is not None:
+            self.on_error(message)
+        else:
+            print(f"[JobTracker] {message}", file=sys.stderr)
+
+    def run(self):
+        while True:
+            items = [self.queue.get()]
+            if items[0][0] == "op":
+                time.sleep(JOURNAL_COALESCE_MS / 1000)
+            while True:
+                try:
+                    items.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            ops = {}
+            for kind, payload in items:
+                if kind == "op":
+                    key = payload["rec"]["id"] if payload["op"] == "put" else payload["id"]
+                    ops.pop(key, None)
+                    ops[key] = payload
+                    continue
+                if ops:
+                    self.write_ops(ops)
+                ops = {}
+                if kind == "compact":
+                    self.write_compaction(*payload)
+                elif kind == "barrier":
+                    payload.set()
+            if ops:
+                self.write_ops(ops)
+            for _ in items:
+                self.queue.task_done()
+
+    def repair(self):
+        # A process that died holding data_lock may have left half a line
+        if data_lock.stale is not None:
+            data_lock.stale = None
+            self.read_from(0, repair=True)
+
+    @perf.timed("journal")
+    def write_ops(self, ops):
+        lines = "".join(json.dumps(op, ensure_ascii=False, separators=(",", ":")) + "\n" for op in ops.values())
+        try:
+            with data_lock:
+                self.repair()
+                with open(self.path, "ab") as f:
+                    f.write(lines.encode("utf-8"))
+                    f.flush()
+                    os.fsync(f.fileno())
+                    end = f.tell()
+                before, after = data_lock.commit()
+                if before == (self.generation, self.compactions):
+                    self.generation, self.offset = after[0], end
+        except Exception as e:
+            self.report(f"Failed to save {len(ops)} change(s): {e}")
+
+    @perf.timed("snapshot")
+    def write_compaction(self, write, backup=False):
+        try:
+            with data_lock:
+                before = data_lock.counters()
+                if before[1] != self.compactions:
+                    # Another process rewrote shards this one has not synced
+                    # yet; writing now could undo its changes. The ops stay
+                    # in the journal and the compaction is retried later
+                    self.pending = max(self.pending, JOURNAL_COMPACT_THRESHOLD)
+                    return
+                self.repair()
+                segment = self.read_ops()
+                count, records = write()
+                # Ops appended by others since this process last synced are
+                # not in the shards just written, so they must stay
+                caught_up = before[0] == self.generation
+                # A crash before this truncate only means replaying ops the
+                # shards already contain
+                if caught_up and os.path.exists(self.path):
+                    with open(self.path, "r+b") as f:
+                        f.truncate(0)
+                        f.flush()
+                        os.fsync(f.fileno())
+                _, after = data_lock.commit(compacted=True)
+                self.compactions = after[1]
+                if caught_up:
+                    self.generation, self.offset = after[0], 0
+                # Still locked: the ops just truncated must reach the
+                # backups before another process can compact again
+                try:
+                    if backup:
+                        backups.add(segment, count, records)
+                    else:
+                        backups.fold(segment)
+                except Exception as e:
+                    print(f"[JobTracker] Backup error: {e}", file=sys.stderr)
+        except Exception as e:
+            self.report(f"Failed to write the application files: {e}")
+        finally:
+            self.compact_queued = False
+
+journal = Journal(JOURNAL_FILE)
+
+# ==============================
+# BACKUPS
+# ==============================
+class BackupStore:
+    """Full snapshots plus compressed deltas, stored by content hash.
+
+    Objects live in backups/objects/<sha256>.z (zlib-compressed JSON), so an
+    identical payload is only ever written once. backups/manifest.json lists
+    every backup point, which is all that listing or picking a restore point
+    needs to read. Deltas are cumulative against their base snapshot, so a
+    restore is at most one full object plus one delta.
+
+    Backup points are taken on a clock (see BACKUP_INTERVAL_S), not per
+    save. Changes made in between are folded into backups/pending.json as
+    compactions drop them from the journal, so the next point still has
+    them. Writers hold data_lock, and all state is read back from disk each
+    time, because other processes back up the same data. list(), exists()
+    and due() only read files that are replaced atomically, so the Tk
+    thread can call them while a snapshot is being written.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self.objects_dir = os.path.join(root, "objects")
+        self.manifest_path = os.path.join(root, "manifest.json")
+        self.pending_path = os.path.join(root, "pending.json")
+        self.lock = threading.Lock()
+        self.manifest = None
+        self.base = None
+        self.changes = None
+        self.has_backup = False
+
+    def load_manifest(self):
+        if self.manifest is None:
+            try:
+                with open(self.manifest_path, "r", encoding="utf-8") as f:
+                    self.manifest = json.load(f)
+            except (OSError, ValueError):
+                self.manifest = []
+        return self.manifest
+
+    def list(self):
+        # Read without self.lock, which add() holds through a whole
+        # snapshot; the manifest is replaced atomically, never edited
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return []
+
+    def exists(self):
+        """Whether there is any backup point; once there is, known without reading the disk."""
+        if not self.has_backup:
+            self.has_backup = bool(self.list())
+        return self.has_backup
+
+    def put_object(self, payload):
+        raw = json.dumps(payload, ensure_ascii=False, sort_keys=True, separators=(",", ":")).encode("utf-8")
+        digest = hashlib.sha256(raw).hexdigest()
+        path = os.path.join(self.objects_dir, digest + ".z")
+        if not os.path.exists(path):
+            os.makedirs(self.objects_dir, exist_ok=True)
+            tmp = path + ".tmp"
+            with open(tmp, "wb") as f:
+                f.write(zlib.compress(raw, 6))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, path)
+        return digest
+
+    def get_object(self, digest):
+        with open(os.path.join(self.objects_dir, digest + ".z"), "rb") as f:
+            return json.loads(zlib.decompress(f.read()).decode("utf-8"))
+
+    def _resume(self):
+        # Rebuild the delta base and accumulated changes from the newest entry
+        self.manifest = None
+        self.base, self.changes = None, {}
+        manifest = self.load_manifest()
+        if not manifest:
+            return
+        last = manifest[-1]
+        try:
+            if last["kind"] == "full":
+                self.base = last["object"]
+            else:
+                delta = self.get_object(last["object"])
+                self.base = last["base"]
+                self.changes = {str(r["id"]): r for r in delta["put"]}
+                self.changes.update({str(i): None for i in delta["del"]})
+        except (OSError, ValueError, KeyError):
+            self.base, self.changes = None, {}
+
+    @staticmethod
+    def _fold(changes, ops):
+        for op in ops:
+            if op.get("op") == "put":
+                changes[str(op["rec"]["id"])] = op["rec"]
+            elif op.get("op") == "del":
+                changes[str(op["id"])] = None
+
+    def _load_pending(self):
+        try:
+            with open(self.pending_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {"full": False, "changes": {}}
+
+    def _save_pending(self, pending):
+        os.makedirs(self.root, exist_ok=True)
+        write_json_atomic(self.pending_path, pending)
+
+    def fold(self, ops):
+        """Keep `ops` for the next backup point without taking one."""
+        if not ops:
+            return
+        with self.lock:
+            pending = self._load_pending()
+            self._fold(pending["changes"], ops)
+            self._save_pending(pending)
+
+    def due(self):
+        """Whether a backup point would hold anything new: changes since the last one, or no point yet."""
+        # Lock-free like list(): pending.json is replaced atomically too
+        pending = self._load_pending()
+        return pending["full"] or bool(pending["changes"]) or not self.exists()
+
+    def add(self, ops, count, records):
+        """Record a backup point; `ops` are the journal ops not yet folded in.
+
+        records() returns all `count` records as dicts. It is only called
+        when a full snapshot is due, so a delta never reads them.
+        """
+        with self.lock:
+            self._resume()
+            pending = self._load_pending()
+            self.changes.update(pending["changes"])
+            self._fold(self.changes, ops)
+
+            manifest = self.load_manifest()
+            deltas = 0
+            for entry in reversed(manifest):
+                if entry["kind"] == "full":
+                    break
+                deltas += 1
+            full = (
+                self.base is None
+                or pending["full"]
+                or deltas >= settings["backup_full_every"]
+                or len(self.changes) * 2 > count
+            )
+            entry = {
+                "ts": datetime.now().isoformat(timespec="seconds"),
+                "count": count,
+            }
+            if full:
+                entry.update(kind="full", object=self.put_object(records()))
+                self.base, self.changes = entry["object"], {}
+            else:
+                delta = {
+                    "base": self.base,
+                    "put": [r for r in self.changes.values() if r is not None],
+                    "del": sorted(int(i) for i, r in self.changes.items() if r is None),
+                }
+                entry.update(kind="delta", object=self.put_object(delta), base=self.base, changes=len(self.changes))
+            manifest.append(entry)
+            self.prune()
+            write_json_atomic(self.manifest_path, manifest, indent=1)
+            self.has_backup = True
+            if os.path.exists(self.pending_path):
+                os.remove(self.pending_path)
+
+    def prune(self):
+        """Thin the manifest to the retention policy and drop unreferenced objects."""
+        manifest = self.manifest
+        if not manifest:
+            return
+        now = datetime.now()
+        tiers = (
+            (settings["backup_keep_hourly"], timedelta(hours=1), lambda t: t.strftime("%Y%m%d%H")),
+            (settings["backup_keep_daily"], timedelta(days=1), lambda t: t.strftime("%Y%m%d")),
+            (settings["backup_keep_weekly"], timedelta(weeks=1), lambda t: "%d-%02d" % t.isocalendar()[:2]),
+        )
+        keep = set(range(max(0, len(manifest) - settings["backup_keep_recent"]), len(manifest)))
+        for count, width, bucket in tiers:
+            cutoff = now - width * count
+            seen = set()
+            for i in range(len(manifest) - 1, -1, -1):
+                ts = datetime.fromisoformat(manifest[i]["ts"])
+                if ts < cutoff:
+                    break
+                key = bucket(ts)
+                if key not in seen:
+                    seen.add(key)
+                    keep.add(i)
+        manifest[:] = [e for i, e in enumerate(manifest) if i in keep]
+
+        referenced = {e["object"] for e in manifest} | {e["base"] for e in manifest if e["kind"] == "delta"}
+        try:
+            names = os.listdir(self.objects_dir)
+        except OSError:
+            return
+        for name in names:
+            if name.endswith(".z") and name[:-2] not in referenced:
+                try:
+                    os.remove(os.path.join(self.objects_dir, name))
+                except OSError:
+                    pass
+
+    def reset(self):
+        # The next backup point must be a full snapshot
+        with self.lock:
+            self._save_pending({"full": True, "changes": {}})
+
+    def restore(self, entry):
+        """Return the records as they were at manifest `entry`."""
+        if entry["kind"] == "full":
+            return self.get_object(entry["object"])
+        delta = self.get_object(entry["object"])
+        records = {x["id"]: x for x in self.get_object(entry["base"])}
+        for r in delta["put"]:
+            records[r["id"]] = r
+        for app_id in delta["del"]:
+            records.pop(app_id, None)
+        return list(records.values())
+
+backups = BackupStore(BACKUP_DIR)
+
+# ==============================
+# RECORD STORE
+# ==============================
+@lru_cache(maxsize=None)
+def iso_to_ordinal(iso):
+    return date.fromisoformat(iso).toordinal()
+
+@lru_cache(maxsize=None)
+def ordinal_to_iso(day):
+    return date.fromordinal(day).isoformat()
+
+@contextmanager
+def gc_paused():
+    """Hold off the cyclic GC while a load builds many objects.
+
+    Records and index entries hold no reference cycles, yet each batch of
+    new allocations makes the collector traverse everything built so far.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
     try:
-        with open(LOCK_FILE, "w") as f:
-            f.write(str(os.getpid()))
-    except OSError:
-        pass
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+class Application:
+    """One job application, in memory.
+
+    Slotted instead of a dict: company and job type strings are interned,
+    apply_date is kept as a date ordinal (`day`) and called_hr/inactive are
+    bits of `flags`.
+    to_dict()/from_dict() convert to and from the JSON record format;
+    unknown keys ride along in `extra`.
+    """
+
+    __slots__ = ("id", "company", "type", "hr_phone", "day", "flags", "extra")
+
+    CALLED_HR = 1
+    INACTIVE = 2
+    FIELDS = ("id", "company", "type", "hr_phone", "apply_date", "called_hr", "inactive")
+
+    def __init__(self, id, company, type, hr_phone, day, flags=0, extra=None):
+        self.id = id
+        self.company = sys.intern(company)
+        self.type = sys.intern(type)
+        self.hr_phone = hr_phone or ""
+        self.day = day
+        self.flags = flags
+        self.extra = extra
+
+    @property
+    def apply_date(self):
+        return ordinal_to_iso(self.day)
+
+    @property
+    def called_hr(self):
+        return bool(self.flags & Application.CALLED_HR)
+
+    @called_hr.setter
+    def called_hr(self, value):
+        self.flags = self.flags | Application.CALLED_HR if value else self.flags & ~Application.CALLED_HR
+
+    @property
+    def inactive(self):
+        return bool(self.flags & Application.INACTIVE)
+
+    @inactive.setter
+    def inactive(self, value):
+        self.flags = self.flags | Application.INACTIVE if value else self.flags & ~Application.INACTIVE
+
+    @classmethod
+    def create(cls, id, company, type, hr_phone, apply_date, called_hr=False, inactive=False, extra=None):
+        flags = (cls.CALLED_HR if called_hr else 0) | (cls.INACTIVE if inactive else 0)
+        return cls(id, company, type, hr_phone, iso_to_ordinal(apply_date), flags, extra)
+
+    @classmethod
+    def from_dict(cls, d):
+        extra = {k: v for k, v in d.items() if k not in cls.FIELDS} or None
+        return cls.create(d["id"], d["company"], d["type"], d.get("hr_phone", ""), d["apply_date"],
+                          d.get("called_hr", False), d.get("inactive", False), extra)
+
+    def to_dict(self):
+        d = {
+            "id": self.id,
+            "company": self.company,
+            "type": self.type,
+            "hr_phone": self.hr_phone,
+            "apply_date": self.apply_date,
+            "called_hr": self.called_hr,
+            "inactive": self.inactive,
+        }
+        if self.extra:
+            d.update(self.extra)
+        return d
+
+    def copy(self):
+        # Strings are interned already, so skip __init__
+        x = Application.__new__(Application)
+        x.id, x.company, x.type, x.hr_phone = self.id, self.company, self.type, self.hr_phone
+        x.day, x.flags, x.extra = self.day, self.flags, self.extra
+        return x
+
+class RecordStore:
+    """Applications keyed by id, in insertion order, with a monotonic id counter.
+
+    Lookups and deletes are dict operations, so every mutation costs the same
+    regardless of size; the dict tombstones deleted slots and compacts them
+    when it resizes. Ids are never reused, even after the newest is deleted.
+    """
+
+    def __init__(self, records=(), next_id=1):
+        self.by_id = {x.id: x for x in records}
+        self.next_id = max(next_id, max(self.by_id, default=0) + 1)
+
+    def __len__(self):
+        return len(self.by_id)
+
+    def __iter__(self):
+        return iter(self.by_id.values())
+
+    def get(self, app_id):
+        return self.by_id.get(app_id)
+
+    def put(self, record):
+        self.by_id[record.id] = record
+        if record.id >= self.next_id:
+            self.next_id = record.id + 1
+
+    def delete(self, app_id):
+        return self.by_id.pop(app_id, None)
+
+class TrigramIndex:
+    """Lower-cased company names split into trigrams, each mapped to the ids containing it.
+
+    A substring search intersects the posting sets of the term's trigrams,
+    smallest first, and verifies only the surviving candidates.
+    """
+
+    def __init__(self, records=()):
+        self.grams = {}
+        self.names = {}
+        self.extend(records)
 
-def release_lock():
+    @staticmethod
+    def trigrams(text):
+        return {text[i:i + 3] for i in range(len(text) - 2)}
+
+    def add(self, app_id, company):
+        name = company.lower()
+        self.names[app_id] = name
+        for gram in self.trigrams(name):
+            self.grams.setdefault(gram, set()).add(app_id)
+
+    def extend(self, records):
+        """add() for a batch of new records, splitting each distinct company name once."""
+        groups = {}
+        for x in records:
+            groups.setdefault(x.company, []).append(x.id)
+        for company, ids in groups.items():
+            name = company.lower()
+            self.names.update(dict.fromkeys(ids, name))
+            for gram in self.trigrams(name):
+                self.grams.setdefault(gram, set()).update(ids)
+
+    def remove(self, app_id):
+        name = self.names.pop(app_id, None)
+        if name is None:
+            return
+        for gram in self.trigrams(name):
+            ids = self.grams[gram]
+            ids.discard(app_id)
+            if not ids:
+                del self.grams[gram]
+
+    def update(self, app_id, company):
+        if self.names.get(app_id) != company.lower():
+            self.remove(app_id)
+            self.add(app_id, company)
+
+    def estimate(self, term):
+        """Upper bound on the size of search(term): its smallest posting set."""
+        if len(term) < 3:
+            return len(self.names)
+        return min((len(self.grams.get(g, ())) for g in self.trigrams(term)), default=0)
+
+    def search(self, term):
+        if len(term) < 3:
+            candidates = self.names
+        else:
+            postings = sorted((self.grams.get(g, set()) for g in self.trigrams(term)), key=len)
+            candidates = postings[0].intersection(*postings[1:])
+        return [i for i in candidates if term in self.names[i]]
+
+class StatsAggregate:
+    """Counts of active applications per day, keyed by (type, called_hr).
+
+    Every mutation moves one record between counters, so the stats bar,
+    graphs and milestone check read a handful of counters instead of
+    scanning the records. verify() compares against a full recompute.
+    """
+
+    def __init__(self, records=()):
+        self.days = {}
+        self.keys = {}
+        for x in records:
+            self.update(x)
+
+    def update(self, record):
+        self.remove(record.id)
+        if record.inactive:
+            return
+        day, cell_key = record.day, (record.type, record.called_hr)
+        self.keys[record.id] = (day, cell_key)
+        self._add(day, cell_key, 1)
+
+    def remove(self, app_id):
+        key = self.keys.pop(app_id, None)
+        if key is None:
+            return
+        self._add(*key, -1)
+
+    def _add(self, day, cell_key, n):
+        cell = self.days.setdefault(day, {})
+        cell[cell_key] = cell.get(cell_key, 0) + n
+        if not cell[cell_key]:
+            del cell[cell_key]
+            if not cell:
+                del self.days[day]
+
+    def add_cells(self, cells, sign=1):
+        """Count (or with sign=-1, uncount) a shard's manifest cells, for
+        records that are not loaded and so have no per-record key."""
+        for day, job_type, called, n in cells:
+            self._add(iso_to_ordinal(day), (job_type, bool(called)), sign * n)
+
+    def _days_between(self, first, last):
+        if first is not None and last is not None and last - first < len(self.days):
+            return [d for d in range(first, last + 1) if d in self.days]
+        return [d for d in self.days if (first is None or d >= first) and (last is None or d <= last)]
+
+    def count(self, start=None, end=None, filter_type="All"):
+        """Return (apps, calls) for active records with start <= apply_date <= end (ISO dates)."""
+        if start and end and start > end:
+            return 0, 0
+        first = iso_to_ordinal(start) if start else None
+        last = iso_to_ordinal(end) if end else None
+        apps = calls = 0
+        for day in self._days_between(first, last):
+            for (job_type, called), n in self.days[day].items():
+                if filter_type == "All" or job_type == filter_type:
+                    apps += n
+                    if called:
+                        calls += n
+        return apps, calls
+
+    def stats(self, today, week_start, month_start, filter_type="All", start=None, end=None):
+        stats = {"total_active": self.count(start, end, filter_type)[0]}
+        for period, since in (("today", today), ("week", week_start), ("month", month_start)):
+            lo = max(since, start) if start else since
+            hi = min(today, end) if end else today
+            stats[f"{period}_apps"], stats[f"{period}_calls"] = self.count(lo, hi, filter_type)
+        return stats
+
+    def day_counts(self, dates, filter_type="All"):
+        counts = [self.count(d, d, filter_type) for d in dates]
+        return [apps for apps, _ in counts], [calls for _, calls in counts]
+
+    def first_day(self):
+        return min(self.days, default=None)
+
+    def bucket_counts(self, starts, last, filter_type="All"):
+        """Return ([apps], [calls]) per bucket in one pass over the counted days.
+
+        Bucket i covers the day ordinals from starts[i] up to the next start;
+        the last bucket ends at `last`.
+        """
+        days, apps, calls = [], [], []
+        for day in sorted(self._days_between(starts[0], last)):
+            a = c = 0
+            for (job_type, called), n in self.days[day].items():
+                if filter_type == "All" or job_type == filter_type:
+                    a += n
+                    if called:
+                        c += n
+            if a:
+                days.append(day)
+                apps.append(a)
+                calls.append(c)
+        np = numpy()
+        if np is not None:
+            index = np.searchsorted(starts, days, side="right") - 1
+            return [np.bincount(index, weights=values, minlength=len(starts)).astype(int).tolist()
+                    for values in (apps, calls)]
+        app_totals, call_totals = [0] * len(starts), [0] * len(starts)
+        for day, a, c in zip(days, apps, calls):
+            i = bisect_right(starts, day) - 1
+            app_totals[i] += a
+            call_totals[i] += c
+        return app_totals, call_totals
+
+    def verify(self, records):
+        return StatsAggregate(records).days == self.days
+
+@lru_cache(maxsize=None)
+def numpy():
+    """NumPy if it is installed, imported on first use since it is slow to load."""
     try:
-        os.remove(LOCK_FILE)
-    except OSError:
-        pass
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+class FollowUpQueue:
+    """Min-heap of follow-up due days (ordinals) for records still waiting on HR.
+
+    `through` is the last day whose deadlines have been handed out by
+    pop_due(), so every record comes due exactly once. A record's due day
+    is kept in `due` after it is popped; update() only pushes a new entry
+    when that day actually changes and is after `through`, and stale heap
+    entries are skipped.
+    """
+
+    def __init__(self, records=(), through=0):
+        self.due = {}
+        self.through = through
+        for x in records:
+            due = self.due_day(x)
+            if due is not None:
+                self.due[x.id] = due
+        self.heap = [(due, app_id) for app_id, due in self.due.items() if due > through]
+        heapq.heapify(self.heap)
+
+    @staticmethod
+    def due_day(record):
+        if record.flags & (Application.CALLED_HR | Application.INACTIVE):
+            return None
+        return record.day + followup_days(record.type)
+
+    def update(self, record):
+        due = self.due_day(record)
+        if due == self.due.get(record.id):
+            return
+        if due is None:
+            del self.due[record.id]
+            return
+        self.due[record.id] = due
+        if due > self.through:
+            heapq.heappush(self.heap, (due, record.id))
+
+    def remove(self, app_id):
+        self.due.pop(app_id, None)
+
+    def live(self, entry):
+        return self.due.get(entry[1]) == entry[0]
+
+    def next_due(self):
+        heap = self.heap
+        while heap and not self.live(heap[0]):
+            heapq.heappop(heap)
+        return heap[0][0] if heap else None
+
+    def pop_due(self, today):
+        ready = []
+        heap = self.heap
+        while heap and heap[0][0] <= today:
+            entry = heapq.heappop(heap)
+            if self.live(entry):
+                ready.append(entry[1])
+        self.through = max(self.through, today)
+        return ready
+
+class Query:
+    """Which rows to show: job type, apply-date range, company search, status and order.
+
+    start/end are inclusive ISO dates or None, and search is a lower-cased
+    substring of the company name. status is one of STATUSES: "active"
+    (not inactive), "ready" (active, not called and past its follow-up
+    window), "called" (active and called) or "all". sort is one of SORTS.
+    """
+
+    __slots__ = ("filter_type", "start", "end", "search", "status", "sort")
+    STATUSES = ("active", "ready", "called", "all")
+    SORTS = ("date_desc", "date_asc", "company")
+
+    def __init__(self, filter_type="All", start=None, end=None, search="", status="active", sort="date_desc"):
+        self.filter_type = filter_type
+        self.start = start
+        self.end = end
+        self.search = search
+        self.status = status
+        self.sort = sort
+
+    def key(self):
+        return (self.filter_type, self.start, self.end, self.search, self.status, self.sort)
+
+    def __eq__(self, other):
+        return isinstance(other, Query) and self.key() == other.key()
+
+    def __hash__(self):
+        return hash(self.key())
+
+    def bounds(self):
+        """Return (first, last) apply-day ordinals, None where the range is open."""
+        return (iso_to_ordinal(self.start) if self.start else None,
+                iso_to_ordinal(self.end) if self.end else None)
+
+class QueryIndex:
+    """Secondary indexes over the records for the query planner.
+
+    `dates` keeps (day, id) pairs sorted, so a date range is two bisects and
+    a slice. `types` maps each job type to its ids, and `active` holds the
+    ids that are not inactive. The key each record was filed under is kept,
+    so update() can move a record that was edited in place.
+    """
+
+    def __init__(self, records=()):
+        self.keys = {}
+        self.types = {}
+        self.active = set()
+        for x in records:
+            self._file(x)
+        self.dates = sorted((day, app_id) for app_id, (day, _, _) in self.keys.items())
 
-acquire_lock()
+    def _file(self, record):
+        key = (record.day, record.type, not record.flags & Application.INACTIVE)
+        self.keys[record.id] = key
+        self.types.setdefault(record.type, set()).add(record.id)
+        if key[2]:
+            self.active.add(record.id)
+        return key
+
+    def update(self, record):
+        if self.keys.get(record.id) == (record.day, record.type, not record.flags & Application.INACTIVE):
+            return
+        self.remove(record.id)
+        insort(self.dates, (self._file(record)[0], record.id))
+
+    def extend(self, records):
+        """File a batch of new records with one sort instead of an insort each."""
+        for x in records:
+            self.dates.append((self._file(x)[0], x.id))
+        self.dates.sort()
+
+    def remove(self, app_id):
+        key = self.keys.pop(app_id, None)
+        if key is None:
+            return
+        day, job_type, active = key
+        del self.dates[bisect_left(self.dates, (day, app_id))]
+        ids = self.types[job_type]
+        ids.discard(app_id)
+        if not ids:
+            del self.types[job_type]
+        self.active.discard(app_id)
+
+    def date_span(self, first, last):
+        """Return the slice of `dates` applied between first and last (ordinals or None)."""
+        lo = 0 if first is None else bisect_left(self.dates, (first,))
+        hi = len(self.dates) if last is None else bisect_left(self.dates, (last + 1,))
+        return lo, max(lo, hi)
 
 # ==============================
-# FILE PATHS
+# STORAGE BACKENDS
 # ==============================
-APP_DIR = os.path.join(os.path.expanduser("~"), ".jobtracker")
-os.makedirs(APP_DIR, exist_ok=True)
+# Both backends answer the same calls. Rows are selected with a Query;
+# stats, day_counts and bucket_counts take filter_type ("All" or a job type)
+# and count active records only. Dates cross the interface as ISO strings.
+
+class JsonStorage:
+    """Month shards plus journal, queried in memory.
+
+    The manifest is read up front and seeds the stats aggregate with every
+    shard's counts, so stats and graphs are complete without parsing a
+    record. Shards are parsed when a query's date range first reaches them,
+    or when a journal op being replayed belongs in them. Every month a
+    mutation touches is marked dirty, and a compaction rewrites only those.
+    `moved` remembers the shard still holding each record whose apply date
+    left its month since the last compaction.
+    """
+
+    def __init__(self):
+        self.records = RecordStore()
+        self.search_index = TrigramIndex()
+        self.index = QueryIndex()
+        self.aggregate = StatsAggregate()
+        self.manifest = {}
+        self.unloaded = set()
+        self.dirty = set()
+        self.moved = {}
+        self.legacy = False
+        self.loading = False
+
+    def load(self, query=None):
+        """Load everything `query` can reach (all of it by default) before returning."""
+        self.load_preview()
+        if self.legacy:
+            self.finish_load(self.load_rest(None))
+            return
+        # No Tk thread to keep responsive, so index the shards in place
+        # instead of rebuilding everything the way load_rest() must
+        self.loading = False
+        self.ensure(*(query.bounds() if query else (None, None)))
+
+    # Progressive startup: load_preview() on the Tk thread, load_rest() on a
+    # worker, then finish_load() back on the Tk thread. Mutations must wait
+    # for finish_load(), which replaces everything the preview held.
+    @perf.timed("preview")
+    def load_preview(self, blocking=True):
+        """Load the manifest, the shards of the current stats window and the journal.
+
+        Never waits for data_lock, so it always returns True; see SQLiteStorage.load_preview().
+        """
+        manifest = load_manifest()
+        if manifest is None and os.path.exists(DATA_FILE):
+            self.load_legacy_preview()
+            return True
+        self.manifest = manifest["shards"] if manifest else {}
+        self.unloaded = set(self.manifest)
+        self.records = RecordStore()
+        self.search_index = TrigramIndex()
+        self.index = QueryIndex()
+        self.aggregate = StatsAggregate()
+        for entry in self.manifest.values():
+            self.aggregate.add_cells(entry["cells"])
+        today = date.today()
+        self.ensure(min(today - timedelta(days=today.weekday()), today.replace(day=1)).toordinal())
+        for op in journal.scan():
+            self.apply(op)
+        self.records.next_id = max(self.records.next_id, load_next_id())
+        self.loading = True
+        return True
+
+    def load_legacy_preview(self):
+        """Newest records of a single-file applications.json, until load_rest() splits it into shards."""
+        records = {x["id"]: x for x in read_snapshot_tail(DATA_FILE, STARTUP_PREVIEW_RECORDS)}
+        for op in journal.read_ops():
+            if op.get("op") == "put":
+                records[op["rec"]["id"]] = op["rec"]
+            elif op.get("op") == "del":
+                records.pop(op["id"], None)
+        self.records = RecordStore(map(Application.from_dict, records.values()), load_meta().get("next_id", 1))
+        self.search_index = TrigramIndex(self.records)
+        self.index = QueryIndex(self.records)
+        self.aggregate = StatsAggregate(self.records)
+        self.manifest, self.unloaded = {}, set()
+        self.legacy = True
+        self.loading = True
+
+    @perf.timed("load")
+    def load_rest(self, progress, query=None):
+        """Read the shards `query` can reach (all by default) and build the state finish_load() installs.
+
+        Runs on a worker; it only reads the preview's records, which stay
+        unchanged while loading.
+        """
+        with gc_paused():
+            return self._load_rest(progress, query)
+
+    def _load_rest(self, progress, query):
+        warnings = []
+        if self.legacy:
+            data = load_data(progress, warnings.append)
+            records = RecordStore(map(Application.from_dict, data), load_next_id())
+            return records, TrigramIndex(records), QueryIndex(records), StatsAggregate(records), set(), warnings
+        months = self.reachable(*(query.bounds() if query else (None, None)))
+        records = RecordStore(self.records, self.records.next_id)
+        for i, month in enumerate(sorted(months)):
+            try:
+                data = read_shard_records(month)
+            except FileNotFoundError:
+                data = ()
+            except (OSError, ValueError, KeyError) as e:
+                warnings.append(f"Skipping {os.path.basename(shard_path(month))}\n{str(e)}")
+                data = ()
+            for record in data:
+                # The journal's version of a record is newer than its shard's
+                if record.id not in records.by_id:
+                    records.put(record)
+            if progress is not None:
+                progress(i + 1, len(months))
+                time.sleep(0)
+        aggregate = StatsAggregate(records)
+        for month in self.unloaded - months:
+            aggregate.add_cells(self.manifest[month]["cells"])
+        return records, TrigramIndex(records), QueryIndex(records), aggregate, months, warnings
+
+    def finish_load(self, state):
+        """Install what load_rest() built and return its warnings."""
+        self.records, self.search_index, self.index, self.aggregate, months, warnings = state
+        self.unloaded -= months
+        self.loading = False
+        if self.legacy:
+            # Write the single-file snapshot out as month shards
+            self.legacy = False
+            self.dirty = {month_of(x.day) for x in self.records}
+            backups.reset()
+            self.compact()
+        return warnings
+
+    def reachable(self, first=None, last=None):
+        """Unloaded months whose records may have applied between first and last (ordinals or None)."""
+        return {
+            month for month in self.unloaded
+            if (first is None or iso_to_ordinal(self.manifest[month]["last"]) >= first)
+            and (last is None or iso_to_ordinal(self.manifest[month]["first"]) <= last)
+        }
+
+    def ensure(self, first=None, last=None):
+        """Load every shard a query between first and last could need.
+
+        A no-op while a background load is running; until it finishes,
+        queries only see what is loaded.
+        """
+        if self.unloaded and not self.loading:
+            months = self.reachable(first, last)
+            if months:
+                self.load_shards(months)
+
+    @perf.timed("shards")
+    def load_shards(self, months):
+        """Read and index the given unloaded shards on the calling thread."""
+        with gc_paused():
+            self._load_shards(months)
+
+    def _load_shards(self, months):
+        added = []
+        for month in months:
+            self.unloaded.discard(month)
+            self.aggregate.add_cells(self.manifest[month]["cells"], -1)
+            try:
+                data = read_shard_records(month)
+            except FileNotFoundError:
+                continue  # emptied by another process since the manifest was read
+            except (OSError, ValueError, KeyError) as e:
+                messagebox.showwarning("Data Load Error", f"Skipping {os.path.basename(shard_path(month))}\n{str(e)}")
+                continue
+            for record in data:
+                if record.id not in self.records.by_id:
+                    self.records.put(record)
+                    self.aggregate.update(record)
+                    added.append(record)
+        self.search_index.extend(added)
+        self.index.extend(added)
+
+    def apply(self, op):
+        """Apply a journal op read back from disk; returns the id it touched."""
+        if op.get("shard") in self.unloaded:
+            self.load_shards({op["shard"]})
+        if op.get("op") == "put":
+            self._put(Application.from_dict(op["rec"]))
+            return op["rec"]["id"]
+        self._delete(op["id"])
+        return op["id"]
+
+    @perf.timed("sync")
+    def sync(self, blocking=False):
+        """Apply what other processes committed since this one last looked.
+
+        Returns the ids of the records that changed, [] when nothing did.
+        Appended ops are replayed from where this process left off. After
+        another process rewrote shards, the months whose manifest entries
+        changed are dropped (they reload on demand) and the whole journal
+        is replayed over them; ops carry full records, so replaying this
+        process's own ops again is harmless. The changed ids are unknown
+        then, and None is returned.
+        """
+        if self.loading or self.legacy or not journal.changed():
+            return []
+        if not blocking and not journal.idle():
+            # The writer may be waiting for data_lock, and flushing would
+            # wait with it; the next call catches up
+            return []
+        # Every op this process queued must be on disk before its records
+        # are compared with the file
+        journal.flush()
+        if not data_lock.acquire(blocking):
+            return []
+        try:
+            signature = data_lock.signature()
+            generation, compactions = data_lock.counters()
+            offset = journal.offset
+            rewritten = compactions != journal.compactions
+            if rewritten:
+                self.reload_manifest()
+                offset = 0
+            journal.repair()
+            ops, end = journal.read_from(offset)
+            changed = [self.apply(op) for op in ops]
+            journal.pending = len(ops) if offset == 0 else journal.pending + len(ops)
+            self.records.next_id = max(self.records.next_id, journal.max_id + 1)
+            journal.generation, journal.compactions, journal.offset = generation, compactions, end
+            journal.seen = signature
+            return None if rewritten else changed
+        finally:
+            data_lock.release()
+
+    def reload_manifest(self):
+        """Take over a manifest rewritten by another process, unloading the months it changed."""
+        manifest = load_manifest()
+        shards = manifest["shards"] if manifest else {}
+        for month in set(self.manifest) | set(shards):
+            old, new = self.manifest.get(month), shards.get(month)
+            if old == new:
+                continue
+            if month in self.unloaded:
+                self.aggregate.add_cells(old["cells"], -1)
+            else:
+                lo, hi = self.index.date_span(*month_span(month))
+                for app_id in [i for _, i in self.index.dates[lo:hi]]:
+                    self.records.delete(app_id)
+                    self.search_index.remove(app_id)
+                    self.index.remove(app_id)
+                    self.aggregate.remove(app_id)
+            if new:
+                self.aggregate.add_cells(new["cells"])
+                self.unloaded.add(month)
+            else:
+                self.unloaded.discard(month)
+            # The journal replay that follows marks it again if needed
+            self.dirty.discard(month)
+        self.manifest = shards
+        self.moved = {}
+
+    def close(self):
+        self.backup(background=False)
+        journal.flush()
+
+    def backup(self, background=True):
+        """Take a backup point if anything changed since the last one."""
+        if self.loading or self.legacy:
+            return
+        if journal.pending or backups.due():
+            self.compact(background, backup=True)
+
+    def all(self):
+        self.ensure()
+        return list(self.records)
+
+    def read_committed(self):
+        """Every committed record, read from the files. Unlike the rest of
+        the store, it can be called from any thread.
+
+        This process's queued writes are flushed first, and data_lock keeps
+        a compaction from rewriting the files halfway through the read.
+        """
+        journal.flush()
+        with data_lock:
+            records = {}
+            manifest = load_manifest()
+            if manifest is not None:
+                for month in manifest["shards"]:
+                    try:
+                        records.update((x.id, x) for x in read_shard_records(month))
+                    except FileNotFoundError:
+                        continue
+                    except (OSError, ValueError, KeyError) as e:
+                        print(f"[JobTracker] Skipping {os.path.basename(shard_path(month))}: {e}", file=sys.stderr)
+            elif os.path.exists(DATA_FILE):
+                with open(DATA_FILE, "r", encoding="utf-8") as f:
+                    records = {x["id"]: Application.from_dict(x) for x in json.load(f)}
+            for op in journal.read_ops():
+                if op.get("op") == "put":
+                    records[op["rec"]["id"]] = Application.from_dict(op["rec"])
+                elif op.get("op") == "del":
+                    records.pop(op["id"], None)
+        return list(records.values())
+
+    def get(self, app_id):
+        return self.records.get(app_id)
+
+    def allocate_id(self, blocking=True):
+        """A new record id; None if `blocking` is false and data_lock is busy."""
+        return self.reserve_ids(1, blocking)
+
+    def reserve_ids(self, count, blocking=True):
+        first = data_lock.reserve_ids(count, self.records.next_id, blocking)
+        if first is not None:
+            self.records.next_id = first + count
+        return first
+
+    def _put(self, record):
+        """Apply a put in memory; returns the journal op's shard hint."""
+        # A month must be loaded before its shard can be rewritten
+        month = month_of(record.day)
+        if month in self.unloaded:
+            self.load_shards({month})
+        self.dirty.add(month)
+        filed = self.index.keys.get(record.id)
+        source = self.moved.get(record.id, month_of(filed[0]) if filed else month)
+        if source != month:
+            self.moved[record.id] = source
+            self.dirty.add(source)
+        else:
+            self.moved.pop(record.id, None)
+        self.records.put(record)
+        self.search_index.update(record.id, record.company)
+        self.index.update(record)
+        self.aggregate.update(record)
+        return self.moved.get(record.id)
+
+    def _delete(self, app_id):
+        """Apply a delete in memory; returns the shard that held the record."""
+        filed = self.index.keys.get(app_id)
+        if filed is None:
+            return None
+        source = self.moved.pop(app_id, month_of(filed[0]))
+        self.dirty.add(source)
+        self.records.delete(app_id)
+        self.search_index.remove(app_id)
+        self.index.remove(app_id)
+        self.aggregate.remove(app_id)
+        return source
+
+    def add(self, record):
+        journal.put(record.to_dict(), self._put(record))
+        self.maybe_compact()
+
+    def update(self, record):
+        journal.put(record.to_dict(), self._put(record))
+        self.maybe_compact()
+
+    def delete(self, app_id):
+        journal.delete(app_id, self._delete(app_id))
+        self.maybe_compact()
+
+    def add_many(self, records):
+        """Add a batch of new records, with ids from reserve_ids(), and commit it as one journal append.
+
+        The shards are left to the next compaction, so an import adding
+        batch after batch rewrites each month once, not once per batch.
+        The ids are new, so the batch is indexed the way a shard load is.
+        """
+        journal.flush()
+        self.sync(blocking=True)
+        records = list(records)
+        months = {month_of(x.day) for x in records}
+        if months & self.unloaded:
+            self.load_shards(months & self.unloaded)
+        self.dirty |= months
+        for record in records:
+            self.records.put(record)
+            self.aggregate.update(record)
+            journal.put(record.to_dict())
+        self.search_index.extend(records)
+        self.index.extend(records)
+        with data_lock:
+            backups.reset()
+        journal.flush()
+        return len(records)
+
+    def replace_all(self, records):
+        journal.flush()
+        with data_lock:
+            # Whatever others committed is replaced too, including shards
+            # this process has never seen
+            journal.take_over()
+            manifest = load_manifest()
+            self.dirty |= set(manifest["shards"] if manifest else ()) | set(self.manifest)
+            self.dirty |= {month_of(x.day) for x in self.records}
+            self.records = RecordStore(records, self.records.next_id)
+            self.search_index = TrigramIndex(self.records)
+            self.index = QueryIndex(self.records)
+            self.aggregate = StatsAggregate(self.records)
+            self.manifest, self.unloaded, self.moved = {}, set(), {}
+            self.dirty |= {month_of(x.day) for x in self.records}
+            backups.reset()
+            self.compact(background=False)
+
+    def maybe_compact(self):
+        # The first save to a data directory also takes its first backup
+        if journal.needs_compaction() or not (journal.compact_queued or backups.exists()):
+            self.compact()
+
+    def compact(self, background=True, backup=False):
+        """Queue a rewrite of the dirty months' shards and the manifest.
+
+        Manifest entries are computed here, on the Tk thread, from the date
+        index; the writer thread only serializes the records.
+        """
+        # A dirty month must be complete in memory before it is rewritten
+        if self.dirty & self.unloaded:
+            self.load_shards(self.dirty & self.unloaded)
+        shards = {}
+        # The counts and cells miss edits like a renamed company, so every
+        # rewritten entry also gets a token of its own; reload_manifest in
+        # the other processes tells changed months apart by it
+        rev = os.urandom(8).hex()
+        for month in self.dirty:
+            lo, hi = self.index.date_span(*month_span(month))
+            records = [self.records.get(i) for _, i in self.index.dates[lo:hi]]
+            entry = shard_entry(records)
+            if entry:
+                entry["rev"] = rev
+                self.manifest[month] = entry
+            else:
+                self.manifest.pop(month, None)
+            shards[month] = records
+        self.dirty = set()
+        self.moved = {}
+        journal.compact(partial(write_shards, shards, dict(self.manifest), self.records.next_id), background,
+                        backup or not backups.exists())
+
+    def plan(self, query):
+        """Pick the cheapest source of candidates for `query`: (cost, name).
+
+        Cost is the number of candidates, doubled for the id sets, whose
+        rows need a full sort; the scan and the date index come out nearly
+        in order.
+        """
+        first, last = query.bounds()
+        plans = [(len(self.records), "scan")]
+        if query.search:
+            plans.append((2 * self.search_index.estimate(query.search), "search"))
+        if first is not None or last is not None:
+            lo, hi = self.index.date_span(first, last)
+            plans.append((hi - lo, "date"))
+        if query.filter_type != "All":
+            plans.append((2 * len(self.index.types.get(query.filter_type, ())), "type"))
+        if query.status != "all":
+            plans.append((2 * len(self.index.active), "active"))
+        return min(plans)
+
+    def select(self, query):
+        """Return (unordered rows matching `query`, plan name).
+
+        Candidates come from the most selective index; every other condition
+        is then checked on the candidates alone, so a date range costs two
+        bisects plus work proportional to the rows in range.
+        """
+        first, last = query.bounds()
+        self.ensure(first, last)
+        _, plan = self.plan(query)
+        get = self.records.get
+        if plan == "search":
+            rows = [get(i) for i in self.search_index.search(query.search)]
+        elif plan == "date":
+            lo, hi = self.index.date_span(first, last)
+            rows = [get(i) for _, i in self.index.dates[lo:hi]]
+        elif plan == "type":
+            rows = [get(i) for i in self.index.types.get(query.filter_type, ())]
+        elif plan == "active":
+            rows = [get(i) for i in self.index.active]
+        else:
+            rows = list(self.records)
+
+        if query.search and plan != "search":
+            names, term = self.search_index.names, query.search
+            rows = [x for x in rows if term in names[x.id]]
+        if query.status != "all" and plan != "active":
+            rows = [x for x in rows if not x.flags & Application.INACTIVE]
+        if query.status == "called":
+            rows = [x for x in rows if x.flags & Application.CALLED_HR]
+        elif query.status == "ready":
+            today = date.today().toordinal()
+            rows = [x for x in rows if not x.flags & Application.CALLED_HR and x.day + followup_days(x.type) <= today]
+        if query.filter_type != "All" and plan != "type":
+            rows = [x for x in rows if x.type == query.filter_type]
+        if plan != "date":
+            if first is not None:
+                rows = [x for x in rows if x.day >= first]
+            if last is not None:
+                rows = [x for x in rows if x.day <= last]
+        return rows, plan
+
+    def query(self, query=None):
+        query = query or Query()
+        rows, plan = self.select(query)
+        # Ties keep id order, matching ORDER BY ..., id in SQLite. A scan
+        # already yields records in insertion (id) order and the date index
+        # in (day, id) order; only the id sets need sorting
+        if plan not in ("scan", "date"):
+            rows.sort(key=attrgetter("id"))
+        rows.sort(key=attrgetter("day"), reverse=query.sort != "date_asc")
+        if query.sort == "company":
+            names = self.search_index.names
+            rows.sort(key=lambda x: names[x.id])
+        return rows
+
+    def stats(self, today, week_start, month_start, query=None):
+        query = query or Query()
+        if not query.search:
+            return self.aggregate.stats(today, week_start, month_start, query.filter_type, query.start, query.end)
+        rows, _ = self.select(Query(query.filter_type, query.start, query.end, query.search))
+        stats = {
+            "today_apps": 0, "week_apps": 0, "month_apps": 0,
+            "today_calls": 0, "week_calls": 0, "month_calls": 0,
+            "total_active": len(rows),
+        }
+        today = iso_to_ordinal(today)
+        periods = (("today", today), ("week", iso_to_ordinal(week_start)), ("month", iso_to_ordinal(month_start)))
+        for x in rows:
+            d = x.day
+            if d > today:
+                continue
+            called = x.called_hr
+            for period, since in periods:
+                if d >= since:
+                    stats[f"{period}_apps"] += 1
+                    if called:
+                        stats[f"{period}_calls"] += 1
+        return stats
+
+    def day_counts(self, dates, filter_type="All"):
+        """Return ([apps per date], [HR calls per date]) for the given ISO dates."""
+        return self.aggregate.day_counts(dates, filter_type)
+
+    def first_day(self):
+        """Ordinal of the earliest active application, or None."""
+        return self.aggregate.first_day()
+
+    def bucket_counts(self, starts, last, filter_type="All"):
+        """Return ([apps], [HR calls]) per bucket; see StatsAggregate.bucket_counts."""
+        return self.aggregate.bucket_counts(starts, last, filter_type)
+
+
+class SQLiteStorage:
+    """applications.db in WAL mode, with filters and stats evaluated by SQLite.
+
+    Every write also appends the ids it touched to the `changes` table (a
+    NULL id for bulk writes), in the same transaction. sync() notices other
+    processes' commits through PRAGMA data_version and refreshes just those
+    ids in the stats aggregate.
+    """
+
+    COLUMNS = ("id", "company", "type", "hr_phone", "apply_date", "called_hr", "inactive")
+
+    def __init__(self, path):
+        self.path = path
+        self.conn = None
+        self.fts = False
+        self.aggregate = StatsAggregate()
+        self.next_id = 1
+        self.ops = []
+        self.backup_thread = None
+        # Until load_preview() and finish_load()
+        self.loading = True
+        self.data_version = None
+        self.change_seq = 0
+
+    def connect(self, path=None):
+        conn = sqlite3.connect(path or self.path)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.create_function("contains_ci", 2, lambda s, term: term in s.lower(), deterministic=True)
+        return conn
+
+    def load(self, query=None):
+        self.load_preview()
+        self.finish_load(self.load_rest(None, query))
+
+    @perf.timed("preview")
+    def load_preview(self, blocking=True):
+        """Open the database; queries are complete from here, stats once the aggregate is built.
+
+        The first open creates it under data_lock. Returns False, without
+        waiting, if that is needed while someone else holds the lock and
+        `blocking` is false.
+        """
+        if not os.path.exists(self.path):
+            if not data_lock.acquire(blocking):
+                return False
+            try:
+                if not os.path.exists(self.path):
+                    self.create()
+            finally:
+                data_lock.release()
+        self.conn = self.connect()
+        self.create_tables()
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'next_id'").fetchone()
+        top = self.conn.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM applications").fetchone()[0]
+        self.next_id = max(row[0] if row else 1, top)
+        self.data_version = self.conn.execute("PRAGMA data_version").fetchone()[0]
+        self.change_seq = self.conn.execute("SELECT COALESCE(MAX(seq), 0) FROM changes").fetchone()[0]
+        self.loading = True
+        return True
+
+    def create(self):
+        # Migrated under another name and renamed into place, so another
+        # process never opens a half-filled database without the lock
+        tmp = self.path + ".new"
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(tmp + suffix):
+                os.remove(tmp + suffix)
+        self.conn = self.connect(tmp)
+        try:
+            self.create_tables()
+            migrate_json_to_sqlite(self)
+        finally:
+            # The last connection to close checkpoints and removes the WAL
+            self.conn.close()
+        os.replace(tmp, self.path)
+
+    def create_tables(self):
+        with self.conn:
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS applications (
+                    id INTEGER PRIMARY KEY,
+                    company TEXT NOT NULL,
+                    type TEXT NOT NULL,
+                    hr_phone TEXT NOT NULL DEFAULT '',
+                    apply_date TEXT NOT NULL,
+                    called_hr INTEGER NOT NULL DEFAULT 0,
+                    inactive INTEGER NOT NULL DEFAULT 0
+                )""")
+            for col in ("apply_date", "type", "inactive", "company"):
+                self.conn.execute(f"CREATE INDEX IF NOT EXISTS idx_applications_{col} ON applications({col})")
+            self.conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value)")
+            self.conn.execute("CREATE TABLE IF NOT EXISTS changes (seq INTEGER PRIMARY KEY AUTOINCREMENT, id INTEGER)")
+        self.fts = self.create_search_index()
+
+    @perf.timed("load")
+    def load_rest(self, progress, query=None):
+        # Runs on a worker thread, so it reads through a connection of its
+        # own. Rows are read per query, so `query` needs nothing preloaded
+        conn = self.connect()
+        try:
+            total = conn.execute("SELECT COUNT(*) FROM applications WHERE inactive = 0").fetchone()[0]
+            cur = conn.execute("SELECT id, apply_date, type, called_hr FROM applications WHERE inactive = 0")
+            aggregate = StatsAggregate()
+            done = 0
+            while True:
+                rows = cur.fetchmany(LOAD_CHUNK_RECORDS)
+                if not rows:
+                    break
+                for i, d, t, c in rows:
+                    aggregate.update(Application.create(i, "", t, "", d, c))
+                done += len(rows)
+                if progress is not None:
+                    progress(done, total)
+        finally:
+            conn.close()
+        return aggregate, []
+
+    def finish_load(self, state):
+        self.aggregate, warnings = state
+        self.loading = False
+        return warnings
+
+    def create_search_index(self):
+        # FTS5 trigram index over company, kept in sync by triggers; without
+        # FTS5 (or for terms under three characters) search scans instead
+        exists = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'applications_fts'").fetchone()
+        try:
+            with self.conn:
+                self.conn.execute("""
+                    CREATE VIRTUAL TABLE IF NOT EXISTS applications_fts USING fts5(
+                        company, content='applications', content_rowid='id', tokenize='trigram')""")
+                self.conn.execute("""
+                    CREATE TRIGGER IF NOT EXISTS applications_fts_ai AFTER INSERT ON applications BEGIN
+                        INSERT INTO applications_fts(rowid, company) VALUES (new.id, new.company);
+                    END""")
+                self.conn.execute("""
+                    CREATE TRIGGER IF NOT EXISTS applications_fts_ad AFTER DELETE ON applications BEGIN
+                        INSERT INTO applications_fts(applications_fts, rowid, company) VALUES ('delete', old.id, old.company);
+                    END""")
+                self.conn.execute("""
+                    CREATE TRIGGER IF NOT EXISTS applications_fts_au AFTER UPDATE OF company ON applications BEGIN
+                        INSERT INTO applications_fts(applications_fts, rowid, company) VALUES ('delete', old.id, old.company);
+                        INSERT INTO applications_fts(rowid, company) VALUES (new.id, new.company);
+                    END""")
+                if not exists:
+                    self.conn.execute("INSERT INTO applications_fts(applications_fts) VALUES ('rebuild')")
+        except sqlite3.OperationalError as e:
+            print(f"[JobTracker] Search index unavailable: {e}", file=sys.stderr)
+            return False
+        return True
+
+    def close(self):
+        if self.backup_thread is not None:
+            self.backup_thread.join()
+        if self.conn is not None:
+            self.backup(background=False)
+            self.conn.execute("PRAGMA optimize")
+            self.conn.close()
+            self.conn = None
+
+    @staticmethod
+    def _row(row):
+        return Application.create(*row)
+
+    def all(self):
+        cur = self.conn.execute(f"SELECT {', '.join(self.COLUMNS)} FROM applications ORDER BY id")
+        return map(self._row, cur)
+
+    def read_committed(self):
+        """Every committed record, through a connection of its own, so any thread can call it."""
+        if not os.path.exists(self.path):
+            return []  # not created yet; connecting would create it empty
+        conn = self.connect()
+        try:
+            return [self._row(r) for r in conn.execute(f"SELECT {', '.join(self.COLUMNS)} FROM applications")]
+        finally:
+            conn.close()
+
+    def get(self, app_id):
+        row = self.conn.execute(f"SELECT {', '.join(self.COLUMNS)} FROM applications WHERE id = ?", (app_id,)).fetchone()
+        return self._row(row) if row else None
+
+    def allocate_id(self, blocking=True):
+        """A new record id; None if `blocking` is false and data_lock is busy."""
+        return self.reserve_ids(1, blocking)
+
+    def reserve_ids(self, count, blocking=True):
+        first = data_lock.reserve_ids(count, self.next_id, blocking)
+        if first is not None:
+            self.next_id = first + count
+        return first
+
+    def insert_many(self, records):
+        """Upsert `records` (any iterable) in one transaction and return how many were written."""
+        state = {"top": self.next_id, "count": 0}
+        ids = []
+
+        def params():
+            for r in records:
+                state["top"] = max(state["top"], r.id + 1)
+                state["count"] += 1
+                if state["count"] <= CHANGE_LOG_KEEP:
+                    ids.append(r.id)
+                yield (r.id, r.company, r.type, r.hr_phone, r.apply_date, int(r.called_hr), int(r.inactive))
+
+        with self.conn:
+            self.conn.executemany(
+                f"INSERT INTO applications ({', '.join(self.COLUMNS)}) VALUES (?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(id) DO UPDATE SET company = excluded.company, type = excluded.type, "
+                "hr_phone = excluded.hr_phone, apply_date = excluded.apply_date, "
+                "called_hr = excluded.called_hr, inactive = excluded.inactive",
+                params(),
+            )
+            self.next_id = state["top"]
+            self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('next_id', ?)", (self.next_id,))
+            self.log_changes(ids if state["count"] <= CHANGE_LOG_KEEP else [None])
+        return state["count"]
+
+    def log_changes(self, ids):
+        # Inside the writing transaction. This process's own entries only
+        # advance change_seq while nobody else's came in between
+        if not ids:
+            return
+        self.conn.executemany("INSERT INTO changes (id) VALUES (?)", [(i,) for i in ids])
+        top = self.conn.execute("SELECT MAX(seq) FROM changes").fetchone()[0]
+        if top - len(ids) == self.change_seq:
+            self.change_seq = top
+
+    @perf.timed("save")
+    def add(self, record):
+        self.insert_many([record])
+        self.aggregate.update(record)
+        self.logged({"op": "put", "rec": record.to_dict()})
+
+    @perf.timed("save")
+    def update(self, record):
+        self.insert_many([record])
+        self.aggregate.update(record)
+        self.logged({"op": "put", "rec": record.to_dict()})
+
+    @perf.timed("save")
+    def delete(self, app_id):
+        with self.conn:
+            self.conn.execute("DELETE FROM applications WHERE id = ?", (app_id,))
+            self.log_changes([app_id])
+        self.aggregate.remove(app_id)
+        self.logged({"op": "del", "id": app_id})
+
+    def add_many(self, records):
+        """Add a batch of new records, with ids from reserve_ids(), in a single transaction."""
+        records = list(records)
+        # Held for the transaction only, so a window adding a record waits
+        # for its id on the event loop instead of on SQLite's write lock
+        with data_lock:
+            count = self.insert_many(records)
+            backups.reset()
+        for record in records:
+            self.aggregate.update(record)
+        return count
+
+    def replace_all(self, records):
+        with self.conn:
+            self.conn.execute("DELETE FROM applications")
+            self.log_changes([None])
+        self.insert_many(records)
+        self.aggregate = StatsAggregate(records)
+        backups.reset()
+        self.ops = []
+
+    def logged(self, op):
+        # Every JOURNAL_COMPACT_THRESHOLD mutations the ops are handed to
+        # the backups for the next point, and the change log is trimmed
+        self.ops.append(op)
+        if not backups.exists():
+            # The first save to a data directory also takes its first backup
+            self.backup()
+            return
+        if len(self.ops) < JOURNAL_COMPACT_THRESHOLD:
+            return
+        # Never waits on the Tk thread: with the lock busy, the next
+        # mutation tries again
+        if not data_lock.acquire(blocking=False):
+            return
+        ops, self.ops = self.ops, []
+        try:
+            backups.fold(ops)
+        except Exception as e:
+            self.ops = ops + self.ops
+            print(f"[JobTracker] Backup error: {e}", file=sys.stderr)
+        finally:
+            data_lock.release()
+        with self.conn:
+            self.conn.execute("DELETE FROM changes WHERE seq <= ?", (self.change_seq - CHANGE_LOG_KEEP,))
+
+    def backup(self, background=True):
+        """Take a backup point if anything changed since the last one.
+
+        It reads through a separate connection on a thread of its own, so
+        the Tk thread never waits for it.
+        """
+        if self.loading or (self.backup_thread is not None and self.backup_thread.is_alive()):
+            return
+        if not (self.ops or backups.due()):
+            return
+        ops, self.ops = self.ops, []
+
+        def run():
+            try:
+                conn = self.connect()
+                try:
+                    with data_lock:
+                        count = conn.execute("SELECT COUNT(*) FROM applications").fetchone()[0]
+                        sql = f"SELECT {', '.join(self.COLUMNS)} FROM applications ORDER BY id"
+                        backups.add(ops, count, lambda: [self._row(r).to_dict() for r in conn.execute(sql)])
+                finally:
+                    conn.close()
+            except Exception as e:
+                print(f"[JobTracker] Backup error: {e}", file=sys.stderr)
+
+        if not background:
+            run()
+            return
+        self.backup_thread = threading.Thread(target=run, daemon=True)
+        self.backup_thread.start()
 
-DATA_FILE = os.path.join(APP_DIR, "applications.json")
-TYPES_FILE = os.path.join(APP_DIR, "job_types.json")
-BACKUP_DIR = os.path.join(APP_DIR, "backups")
-MILESTONE_FILE = os.path.join(APP_DIR, "milestones.json")
 
-os.makedirs(BACKUP_DIR, exist_ok=True)
+    @perf.timed("sync")
+    def sync(self, blocking=False):
+        """Apply what other processes committed since this one last looked.
+
+        Returns the ids that changed, [] when nothing did, or None when the
+        change log cannot say (a bulk write, or one that did not log) and
+        the aggregate was rebuilt.
+        """
+        if self.loading:
+            return []
+        version = self.conn.execute("PRAGMA data_version").fetchone()[0]
+        if version == self.data_version:
+            return []
+        self.data_version = version
+        low, high = self.conn.execute("SELECT MIN(seq), MAX(seq) FROM changes").fetchone()
+        ids = []
+        if high is not None and high > self.change_seq and low <= self.change_seq + 1:
+            ids = [i for (i,) in self.conn.execute("SELECT id FROM changes WHERE seq > ?", (self.change_seq,))]
+        self.change_seq = max(self.change_seq, high or 0)
+        top = self.conn.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM applications").fetchone()[0]
+        self.next_id = max(self.next_id, top)
+        if not ids or None in ids:
+            self.aggregate = self.load_rest(None)[0]
+            return None
+        ids = list(dict.fromkeys(ids))
+        for app_id in ids:
+            record = self.get(app_id)
+            if record is None:
+                self.aggregate.remove(app_id)
+            else:
+                self.aggregate.update(record)
+        return ids
+
+    ORDER_BY = {
+        "date_desc": "apply_date DESC, id",
+        "date_asc": "apply_date, id",
+        "company": "lower(company), apply_date DESC, id",
+    }
+
+    def _where(self, query):
+        clauses, params = [], {}
+        if query.status != "all":
+            clauses.append("inactive = 0")
+        if query.status == "called":
+            clauses.append("called_hr = 1")
+        elif query.status == "ready":
+            windows = settings["followup_days_by_type"]
+            window = ":window"
+            if windows:
+                cases = " ".join(f"WHEN :window_type{i} THEN :window{i}" for i in range(len(windows)))
+                window = f"CASE type {cases} ELSE :window END"
+                for i, (job_type, days) in enumerate(windows.items()):
+                    params[f"window_type{i}"], params[f"window{i}"] = job_type, days
+            clauses.append(f"called_hr = 0 AND julianday(:today) - julianday(apply_date) >= {window}")
+            params["today"], params["window"] = date.today().isoformat(), settings["followup_days"]
+        if query.filter_type != "All":
+            clauses.append("type = :type")
+            params["type"] = query.filter_type
+        if query.start:
+            clauses.append("apply_date >= :start")
+            params["start"] = query.start
+        if query.end:
+            clauses.append("apply_date <= :end")
+            params["end"] = query.end
+        if query.search:
+            if self.fts and len(query.search) >= 3:
+                clauses.append("id IN (SELECT rowid FROM applications_fts WHERE applications_fts MATCH :match)")
+                params["match"] = '"' + query.search.replace('"', '""') + '"'
+            clauses.append("contains_ci(company, :search)")
+            params["search"] = query.search
+        return " AND ".join(clauses) or "1", params
+
+    def query(self, query=None):
+        query = query or Query()
+        where, params = self._where(query)
+        cur = self.conn.execute(
+            f"SELECT {', '.join(self.COLUMNS)} FROM applications WHERE {where} ORDER BY {self.ORDER_BY[query.sort]}",
+            params,
+        )
+        return [self._row(r) for r in cur]
+
+    def stats(self, today, week_start, month_start, query=None):
+        query = query or Query()
+        if not query.search:
+            return self.aggregate.stats(today, week_start, month_start, query.filter_type, query.start, query.end)
+        where, params = self._where(Query(query.filter_type, query.start, query.end, query.search))
+        row = self.conn.execute(f"""
+            SELECT COUNT(*),
+                   TOTAL(apply_date = :today),
+                   TOTAL(apply_date BETWEEN :week AND :today),
+                   TOTAL(apply_date BETWEEN :month AND :today),
+                   TOTAL(called_hr AND apply_date = :today),
+                   TOTAL(called_hr AND apply_date BETWEEN :week AND :today),
+                   TOTAL(called_hr AND apply_date BETWEEN :month AND :today)
+            FROM applications WHERE {where}
+        """, {"today": today, "week": week_start, "month": month_start, **params}).fetchone()
+        keys = ("total_active", "today_apps", "week_apps", "month_apps", "today_calls", "week_calls", "month_calls")
+        return {k: int(v) for k, v in zip(keys, row)}
+
+    def day_counts(self, dates, filter_type="All"):
+        """Return ([apps per date], [HR calls per date]) for the given ISO dates."""
+        return self.aggregate.day_counts(dates, filter_type)
+
+    def first_day(self):
+        """Ordinal of the earliest active application, or None."""
+        return self.aggregate.first_day()
+
+    def bucket_counts(self, starts, last, filter_type="All"):
+        """Return ([apps], [HR calls]) per bucket; see StatsAggregate.bucket_counts."""
+        return self.aggregate.bucket_counts(starts, last, filter_type)
+
+
+def migrate_json_to_sqlite(storage):
+    """One-shot import of the JSON data (and its journal) into a fresh database."""
+    if not any(os.path.exists(p) for p in (MANIFEST_FILE, DATA_FILE, JOURNAL_FILE)):
+        return 0
+    records = [Application.from_dict(x) for x in load_data()]
+    storage.next_id = load_next_id()
+    storage.insert_many(records)
+    print(f"[JobTracker] Migrated {len(records)} applications to {storage.path}", file=sys.stderr)
+    return len(records)
+
+
+def create_storage():
+    if settings["storage"] == "sqlite":
+        return SQLiteStorage(DB_FILE)
+    return JsonStorage()
+
+def open_storage(query=None):
+    """A loaded store; with `query`, the JSON backend only reads the shards it reaches."""
+    store = create_storage()
+    store.load(query)
+    return store
 
 # ==============================
 # DATA FUNCTIONS
@@ -77,28 +2357,360 @@ def save_job_types(types):
             json.dump(types, f, indent=2)
     except Exception as e:
         messagebox.showerror("Save Error", f"Failed to save job types:\n{str(e)}")
+        return False
+    return True
 
-def load_data():
-    if not os.path.exists(DATA_FILE):
-        return []
+def load_data(progress=None, warn=None):
+    """Every record as a dict: all month shards, or the old single-file
+    snapshot, plus the journal. With `progress`, a single-file snapshot is
+    parsed in chunks (see iter_snapshot); `warn` replaces the message box
+    off the Tk thread."""
+    if warn is None:
+        warn = lambda message: messagebox.showwarning("Data Load Error", message)
+    data = []
+    manifest = load_manifest()
+    if manifest is not None:
+        for month in sorted(manifest["shards"]):
+            try:
+                data.extend(read_shard(month))
+            except (OSError, ValueError) as e:
+                warn(f"Skipping {os.path.basename(shard_path(month))}\n{str(e)}")
+    elif os.path.exists(DATA_FILE):
+        try:
+            if progress is None:
+                with open(DATA_FILE, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+            else:
+                data = list(iter_snapshot(DATA_FILE, progress))
+        except Exception as e:
+            warn(f"Using empty data\n{str(e)}")
+            return []
     try:
-        with open(DATA_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return journal.replay(data)
     except Exception as e:
-        messagebox.showwarning("Data Load Error", f"Using empty data\n{str(e)}")
+        warn(f"Journal could not be replayed\n{str(e)}")
+        return data
+
+SNAPSHOT_GAP = re.compile(r"[\s,]*")
+
+def iter_snapshot(path, progress=None):
+    """Yield the records of a snapshot one at a time.
+
+    Each record is decoded separately, so a worker thread gives up the GIL
+    between records instead of holding it for a whole-file json.load.
+    progress(chars parsed, total chars) is called every LOAD_CHUNK_RECORDS.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        text = f.read()
+    decoder = json.JSONDecoder()
+    pos = SNAPSHOT_GAP.match(text).end()
+    if text[pos:pos + 1] != "[":
+        raise ValueError("applications.json is not a list")
+    count = 0
+    while True:
+        pos = SNAPSHOT_GAP.match(text, pos + 1 if count == 0 else pos).end()
+        if text[pos:pos + 1] == "]":
+            break
+        record, pos = decoder.raw_decode(text, pos)
+        yield record
+        count += 1
+        if count % LOAD_CHUNK_RECORDS == 0 and progress is not None:
+            progress(pos, len(text))
+            time.sleep(0)
+
+def read_snapshot_tail(path, count):
+    """Best-effort read of the last `count` records of a snapshot, or [].
+
+    Snapshots are written with indent=2, so each record starts on a line
+    with exactly two spaces before its brace. Blocks are read backwards from
+    the end until enough of those starts are found.
+    """
+    if not os.path.exists(path):
+        return []
+    try:
+        size = os.path.getsize(path)
+        block = max(65536, count * 256)
+        with open(path, "rb") as f:
+            while True:
+                start = max(0, size - block)
+                f.seek(start)
+                tail = f.read(size - start)
+                marks = [m.start() + 3 for m in re.finditer(rb"\n  \{", tail)]
+                if len(marks) > count or start == 0:
+                    break
+                block *= 4
+        if not marks:
+            return []
+        text = tail[marks[-count:][0]:].decode("utf-8")
+        decoder = json.JSONDecoder()
+        records, pos = [], 0
+        while len(records) < count:
+            record, pos = decoder.raw_decode(text, pos)
+            records.append(record)
+            pos = SNAPSHOT_GAP.match(text, pos).end()
+            if text[pos:pos + 1] != "{":
+                break
+        return records
+    except (OSError, ValueError):
         return []
 
-def save_data(data):
+def write_json_atomic(path, obj, **kwargs):
+    write_text_atomic(path, json.dumps(obj, ensure_ascii=False, **kwargs))
+
+def write_text_atomic(path, text):
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
     try:
-        os.makedirs(APP_DIR, exist_ok=True)
-        with open(DATA_FILE, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M")
-        backup_path = os.path.join(BACKUP_DIR, f"backup_{timestamp}.json")
-        with open(backup_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-    except Exception as e:
-        messagebox.showerror("Save Error", str(e))
+        # Make the rename itself durable (not possible on Windows)
+        fd = os.open(os.path.dirname(path), os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass
+
+def load_meta():
+    try:
+        with open(META_FILE, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def load_next_id():
+    # Ids deleted since the last snapshot are only known from the journal
+    return max(load_meta().get("next_id", 1), journal.max_id + 1)
+
+# Month shards: applications-YYYY-MM.json holds the records applied in that
+# month, and applications.manifest.json summarizes every shard (see
+# shard_entry), so stats, graphs and the choice of shards to read for a
+# date range never open the shards themselves.
+SHARD_FILE = re.compile(r"applications-(\d{4}-\d{2})\.json$")
+MANIFEST_VERSION = 1
+
+@lru_cache(maxsize=None)
+def month_of(day):
+    """"YYYY-MM" of a day ordinal."""
+    return ordinal_to_iso(day)[:7]
+
+def month_span(month):
+    """First and last day ordinals of a "YYYY-MM" month."""
+    first = date.fromisoformat(month + "-01")
+    following = (first + timedelta(days=32)).replace(day=1)
+    return first.toordinal(), following.toordinal() - 1
+
+def shard_path(month):
+    return os.path.join(APP_DIR, f"applications-{month}.json")
+
+def read_shard(month):
+    with open(shard_path(month), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def read_shard_records(month):
+    """A shard's records as Applications, from its binary cache when that is current.
+
+    A shard read from JSON gets its cache written on the way, unless another
+    thread or process is writing at the moment.
+    """
+    if not settings["shard_cache"]:
+        return [Application.from_dict(x) for x in read_shard(month)]
+    records = read_shard_cache(month)
+    if records is not None:
+        return records
+    source = os.stat(shard_path(month))
+    records = [Application.from_dict(x) for x in read_shard(month)]
+    if data_lock.acquire(blocking=False):
+        try:
+            write_shard_cache(month, records, source)
+        except OSError as e:
+            print(f"[JobTracker] Could not cache {month}: {e}", file=sys.stderr)
+        finally:
+            data_lock.release()
+    return records
+
+# Binary shard cache: applications-YYYY-MM.bin holds a shard's records
+# column by column, so loading skips json.load and the per-record dicts.
+# The header records the size and mtime of the JSON shard it was made
+# from. If it no longer matches, or the checksum fails, the JSON is read
+# instead; the JSON shards stay the source of truth.
+SHARD_CACHE_MAGIC = b"JTSHARD\0"
+SHARD_CACHE_VERSION = 1
+# magic, version, record count, crc32 of the body, JSON shard size and
+# mtime_ns, then the byte lengths of the type, company, phone and extra
+# blobs that follow the fixed-width columns
+SHARD_CACHE_HEADER = struct.Struct("<8sHIIqqIIII")
+# Typecodes of the fixed-width columns: id, day, flags, index into the types
+SHARD_CACHE_COLUMNS = ("q", "i", "B", "H")
+
+def shard_cache_path(month):
+    return os.path.join(APP_DIR, f"applications-{month}.bin")
+
+def write_shard_cache(month, records, source):
+    """Write the cache of a shard that was just written from, or read as, `records`.
+
+    `source` is the os.stat() of the JSON shard those records came from; if
+    the shard has changed since then, no cache is written. Records that
+    cannot be packed leave the month without one.
+    """
+    path = shard_cache_path(month)
+    current = os.stat(shard_path(month))
+    if (current.st_size, current.st_mtime_ns) != (source.st_size, source.st_mtime_ns):
+        return
+    types = sorted({x.type for x in records})
+    kinds = {t: i for i, t in enumerate(types)}
+    texts = [types, [x.company for x in records], [x.hr_phone for x in records]]
+    blobs = ["\0".join(column) for column in texts]
+    extras = {i: x.extra for i, x in enumerate(records) if x.extra}
+    try:
+        if any(blob.count("\0") != len(column) - 1 for blob, column in zip(blobs, texts)):
+            raise ValueError("NUL in a text field")
+        columns = [
+            array("q", [x.id for x in records]),
+            array("i", [x.day for x in records]),
+            array("B", [x.flags for x in records]),
+            array("H", [kinds[x.type] for x in records]),
+        ]
+        blobs = [blob.encode("utf-8") for blob in blobs]
+        blobs.append(json.dumps(extras, ensure_ascii=False).encode("utf-8") if extras else b"")
+    except (TypeError, ValueError, OverflowError):
+        if os.path.exists(path):
+            os.remove(path)
+        return
+    if sys.byteorder == "big":
+        for column in columns:
+            column.byteswap()
+    body = b"".join([*(column.tobytes() for column in columns), *blobs])
+    header = SHARD_CACHE_HEADER.pack(SHARD_CACHE_MAGIC, SHARD_CACHE_VERSION, len(records), zlib.crc32(body),
+                                     source.st_size, source.st_mtime_ns, *map(len, blobs))
+    # Not fsynced: a cache lost or torn in a crash fails its checks and is rebuilt
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(header)
+        f.write(body)
+    os.replace(tmp, path)
+
+def read_shard_cache(month):
+    """The records of a shard from its cache, or None if the cache is missing or stale."""
+    try:
+        with open(shard_cache_path(month), "rb") as f:
+            data = f.read()
+        source = os.stat(shard_path(month))
+    except OSError:
+        return None
+    pos = SHARD_CACHE_HEADER.size
+    if len(data) < pos:
+        return None
+    magic, version, count, crc, size, mtime, *lengths = SHARD_CACHE_HEADER.unpack_from(data)
+    if (magic != SHARD_CACHE_MAGIC or version != SHARD_CACHE_VERSION
+            or (size, mtime) != (source.st_size, source.st_mtime_ns)
+            or len(data) != pos + count * 15 + sum(lengths)
+            or zlib.crc32(memoryview(data)[pos:]) != crc):
+        return None
+    columns = []
+    for code in SHARD_CACHE_COLUMNS:
+        column = array(code)
+        end = pos + count * column.itemsize
+        column.frombytes(data[pos:end])
+        if sys.byteorder == "big":
+            column.byteswap()
+        columns.append(column)
+        pos = end
+    texts = []
+    for n in lengths:
+        texts.append(data[pos:pos + n].decode("utf-8"))
+        pos += n
+    types, companies, phones = (text.split("\0") for text in texts[:3])
+    if len(companies) != count or len(phones) != count:
+        return None
+    try:
+        records = [Application(i, company, types[kind], phone, day, flags)
+                   for i, day, flags, kind, company, phone in zip(*columns, companies, phones)]
+    except IndexError:
+        return None
+    if texts[3]:
+        for i, extra in json.loads(texts[3]).items():
+            records[int(i)].extra = extra
+    return records
+
+def shard_entry(records):
+    """Manifest entry for one month's records, or None if there are none.
+
+    Besides the record count and apply-date range it keeps the active
+    counts per (day, type, called_hr) that StatsAggregate is made of.
+    JsonStorage.compact adds the "rev" token of the rewrite.
+    """
+    if not records:
+        return None
+    cells = {}
+    for x in records:
+        if not x.flags & Application.INACTIVE:
+            key = (x.apply_date, x.type, int(x.called_hr))
+            cells[key] = cells.get(key, 0) + 1
+    days = [x.day for x in records]
+    return {
+        "count": len(records),
+        "first": ordinal_to_iso(min(days)),
+        "last": ordinal_to_iso(max(days)),
+        "cells": [[*key, n] for key, n in sorted(cells.items())],
+    }
+
+def load_manifest():
+    """The shard manifest, or None if the data has never been written as shards.
+
+    A damaged manifest is rebuilt by reading every shard on disk.
+    """
+    try:
+        with open(MANIFEST_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        print(f"[JobTracker] Rebuilding {MANIFEST_FILE}: {e}", file=sys.stderr)
+    shards = {}
+    for name in sorted(os.listdir(APP_DIR)):
+        match = SHARD_FILE.match(name)
+        if match:
+            try:
+                entry = shard_entry(read_shard_records(match.group(1)))
+            except (OSError, ValueError, KeyError) as e:
+                print(f"[JobTracker] Skipping {name}: {e}", file=sys.stderr)
+                continue
+            if entry:
+                shards[match.group(1)] = entry
+    return {"version": MANIFEST_VERSION, "shards": shards}
+
+def write_shards(shards, manifest, next_id):
+    """Writer-thread half of a compaction.
+
+    Rewrites the shards of the months in `shards` (removing emptied ones),
+    then the manifest that makes them current. Returns the record count and
+    a function reading every shard back, for BackupStore.add.
+    """
+    os.makedirs(APP_DIR, exist_ok=True)
+    for month, records in shards.items():
+        path = shard_path(month)
+        if records:
+            # One record per line: still readable, and unlike indent= it
+            # keeps json's C encoder, which matters while data_lock is held
+            lines = ",\n".join(json.dumps(x.to_dict(), ensure_ascii=False) for x in records)
+            write_text_atomic(path, f"[\n{lines}\n]\n")
+            if settings["shard_cache"]:
+                write_shard_cache(month, records, os.stat(path))
+        else:
+            for stale in (path, shard_cache_path(month)):
+                if os.path.exists(stale):
+                    os.remove(stale)
+    write_json_atomic(MANIFEST_FILE, {"version": MANIFEST_VERSION, "shards": manifest}, indent=1)
+    write_json_atomic(META_FILE, {"next_id": next_id})
+    if os.path.exists(DATA_FILE):
+        # Every record of the old single-file snapshot is in the shards now
+        os.remove(DATA_FILE)
+    count = sum(entry["count"] for entry in manifest.values())
+    return count, lambda: [x for month in sorted(manifest) for x in read_shard(month)]
 
 def load_milestones():
     if not os.path.exists(MILESTONE_FILE):
@@ -109,20 +2721,233 @@ def load_milestones():
     except:
         return {"last_daily": ""}
 
-def save_milestones(milestones):
-    try:
-        with open(MILESTONE_FILE, "w") as f:
-            json.dump(milestones, f)
-    except:
-        pass
+def save_milestones(milestones):
+    try:
+        with open(MILESTONE_FILE, "w") as f:
+            json.dump(milestones, f)
+    except:
+        pass
+
+DEFAULT_SETTINGS = {
+    # "json" (month shards + journal) or "sqlite" (applications.db,
+    # migrated from the JSON files the first time it is opened)
+    "storage": "json",
+    # Port of the read-only JSON API on 127.0.0.1, or None for no server
+    "api_port": None,
+    # Keep a binary copy of each month shard (applications-YYYY-MM.bin)
+    # that loads several times faster than the JSON
+    "shard_cache": True,
+    # Delay after the last keystroke before the search box filters the table
+    "search_debounce_ms": 150,
+    # Backups: a full snapshot after this many deltas; the newest
+    # backup_keep_recent points are kept, plus the newest backup per
+    # hour/day/week for this many hours/days/weeks
+    "backup_full_every": 10,
+    "backup_keep_recent": 10,
+    "backup_keep_hourly": 24,
+    "backup_keep_daily": 14,
+    "backup_keep_weekly": 8,
+    # Days after applying before a follow-up call is due, with overrides
+    # per job type, e.g. {"Remote": 10}
+    "followup_days": 7,
+    "followup_days_by_type": {},
+}
+
+def load_settings():
+    merged = dict(DEFAULT_SETTINGS)
+    if not os.path.exists(SETTINGS_FILE):
+        return merged
+    try:
+        with open(SETTINGS_FILE, "r") as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            merged.update(data)
+    except Exception as e:
+        print(f"[JobTracker] Settings error: {e}", file=sys.stderr)
+    return merged
+
+settings = load_settings()
+
+def followup_days(job_type):
+    return settings["followup_days_by_type"].get(job_type, settings["followup_days"])
+
+def longest_followup():
+    return max([settings["followup_days"], *settings["followup_days_by_type"].values()])
+
+# ==============================
+# EXPORT
+# ==============================
+# Writers take (path, rows, total, query, progress) and stream `rows`
+# (Application objects) straight to disk, calling progress(done, total)
+# every EXPORT_PROGRESS_EVERY rows. They return the file to open.
+
+HTML_HEAD = """<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <title>Job Application Summary</title>
+    <style>
+        body { font-family: Segoe UI, sans-serif; background: #0f0f0f; color: #d0d0d0; padding: 20px; }
+        h1 { color: #4fc3f7; text-align: center; }
+        a { color: #4fc3f7; }
+        .stats { background: #1a1a1a; padding: 15px; border-radius: 8px; margin: 20px 0; }
+        .pages { text-align: center; margin: 10px 0; }
+        table { width: 100%; border-collapse: collapse; margin-top: 20px; }
+        th, td { padding: 10px; text-align: center; border-bottom: 1px solid #333; }
+        tr.ready { background: #253525; }
+        .status-called { color: #69f0ae; }
+        .status-ready { color: #ffcc00; }
+    </style>
+</head>
+<body>
+"""
+
+def export_page_path(path, page):
+    root, ext = os.path.splitext(path)
+    return path if page == 1 else f"{root}-{page}{ext}"
+
+def write_html(path, rows, total, query, progress=None):
+    esc = html.escape
+    today = datetime.today().toordinal()
+    pages = max(1, -(-total // EXPORT_PAGE_ROWS))
+    summary = (
+        f"<strong>Filter:</strong> Type={esc(query.filter_type)}, "
+        f"Date={query.start or 'Any'} to {query.end or 'Any'}"
+        + (f", Search={esc(query.search)}" if query.search else "")
+        + (f", Status={query.status.title()}" if query.status != "active" else "")
+        + f"<br>\n<strong>Total Applications:</strong> {total}"
+    )
+    generated = datetime.now().strftime("%Y-%m-%d %H:%M")
+    rows = iter(rows)
+    done = 0
+    for page in range(1, pages + 1):
+        nav = []
+        if page > 1:
+            nav.append(f'<a href="{esc(os.path.basename(export_page_path(path, page - 1)))}">&larr; Previous</a>')
+        if pages > 1:
+            nav.append(f"Page {page} of {pages}")
+        if page < pages:
+            nav.append(f'<a href="{esc(os.path.basename(export_page_path(path, page + 1)))}">Next &rarr;</a>')
+        nav = f'<div class="pages">{" | ".join(nav)}</div>\n' if nav else ""
+        with open(export_page_path(path, page), "w", encoding="utf-8") as f:
+            f.write(HTML_HEAD)
+            f.write(f'<h1>Job Application Summary</h1>\n<div class="stats">{summary}</div>\n{nav}')
+            f.write("<table>\n<thead><tr><th>Company</th><th>Type</th><th>Apply Date</th><th>Status</th></tr></thead>\n<tbody>\n")
+            for _, item in zip(range(EXPORT_PAGE_ROWS), rows):
+                days_left = max(0, followup_days(item.type) - (today - item.day))
+                if item.inactive:
+                    status = "⏹️ Inactive"
+                    css_class = ""
+                elif item.called_hr:
+                    status = '<span class="status-called">✅ Called</span>'
+                    css_class = ""
+                elif days_left == 0:
+                    status = '<span class="status-ready">⏳ Ready</span>'
+                    css_class = "ready"
+                else:
+                    status = f"{days_left}d"
+                    css_class = ""
+                f.write(f'<tr class="{css_class}"><td>{esc(item.company)}</td><td>{esc(item.type)}</td>'
+                        f"<td>{item.apply_date}</td><td>{status}</td></tr>\n")
+                done += 1
+                if progress and done % EXPORT_PROGRESS_EVERY == 0:
+                    progress(done, total)
+            f.write("</tbody>\n</table>\n")
+            f.write(nav)
+            f.write(f'<p style="text-align: center; margin-top: 30px; color: #777;">Generated on {generated}</p>\n</body>\n</html>\n')
+    # Drop pages left over from a longer earlier export
+    page = pages + 1
+    while os.path.exists(export_page_path(path, page)):
+        os.remove(export_page_path(path, page))
+        page += 1
+    return path
+
+def write_csv(path, rows, total, query, progress=None):
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(Application.FIELDS)
+        for done, item in enumerate(rows, 1):
+            writer.writerow((item.id, item.company, item.type, item.hr_phone, item.apply_date,
+                             item.called_hr, item.inactive))
+            if progress and done % EXPORT_PROGRESS_EVERY == 0:
+                progress(done, total)
+    return path
 
-def get_week_dates():
-    today = datetime.today().date()
-    return [(today - timedelta(days=i)).isoformat() for i in range(6, -1, -1)]
+def write_jsonl(path, rows, total, query, progress=None):
+    with open(path, "w", encoding="utf-8") as f:
+        for done, item in enumerate(rows, 1):
+            f.write(json.dumps(item.to_dict(), ensure_ascii=False))
+            f.write("\n")
+            if progress and done % EXPORT_PROGRESS_EVERY == 0:
+                progress(done, total)
+    return path
+
+EXPORTERS = {
+    "HTML": ("summary.html", write_html),
+    "CSV": ("summary.csv", write_csv),
+    "JSONL": ("summary.jsonl", write_jsonl),
+}
 
 # ==============================
 # FIREWORKS CELEBRATION
 # ==============================
+class ParticlePool:
+    """Fixed set of canvas ovals animated in place.
+
+    Particle state lives in parallel arrays indexed by slot, and each slot
+    owns one oval that is created up front and hidden while the slot is
+    free. Dead particles are swap-removed from `live`. spawn() drops the
+    particle when the pool is full or the last frame ran over budget.
+    """
+
+    def __init__(self, canvas, size):
+        self.canvas = canvas
+        self.items = [canvas.create_oval(0, 0, 0, 0, outline="", state="hidden") for _ in range(size)]
+        self.x = array("d", bytes(8 * size))
+        self.y = array("d", bytes(8 * size))
+        self.dx = array("d", bytes(8 * size))
+        self.dy = array("d", bytes(8 * size))
+        self.gravity = array("d", bytes(8 * size))
+        self.radius = array("d", bytes(8 * size))
+        self.life = array("i", bytes(4 * size))
+        self.free = list(range(size - 1, -1, -1))
+        self.live = []
+        self.overloaded = False
+
+    def spawn(self, x, y, dx, dy, gravity, radius, life, color):
+        if self.overloaded or not self.free:
+            return False
+        slot = self.free.pop()
+        self.x[slot], self.y[slot], self.dx[slot], self.dy[slot] = x, y, dx, dy
+        self.gravity[slot], self.radius[slot], self.life[slot] = gravity, radius, life
+        item = self.items[slot]
+        self.canvas.coords(item, x - radius, y - radius, x + radius, y + radius)
+        self.canvas.itemconfigure(item, fill=color, state="normal")
+        self.live.append(slot)
+        return True
+
+    def step(self):
+        """Advance every live particle one frame. Returns False once all are dead."""
+        x, y, dx, dy, gravity, radius, life = self.x, self.y, self.dx, self.dy, self.gravity, self.radius, self.life
+        items, live, coords = self.items, self.live, self.canvas.coords
+        i = 0
+        while i < len(live):
+            s = live[i]
+            life[s] -= 1
+            if life[s] <= 0:
+                self.canvas.itemconfigure(items[s], state="hidden")
+                self.free.append(s)
+                live[i] = live[-1]
+                live.pop()
+                continue
+            x[s] += dx[s]
+            y[s] += dy[s]
+            dy[s] += gravity[s]
+            r = radius[s]
+            coords(items[s], x[s] - r, y[s] - r, x[s] + r, y[s] + r)
+            i += 1
+        return bool(live)
+
 def show_fireworks(title, message):
     win = tk.Toplevel()
     win.title("🎉 Achievement Unlocked!")
@@ -141,62 +2966,610 @@ def show_fireworks(title, message):
     close_btn = ttk.Button(win, text="Close", command=win.destroy)
     close_btn.pack(pady=20)
 
-    particles = []
-    confetti = []
+    pool = ParticlePool(canvas, FIREWORK_POOL_SIZE)
     colors = ["#ff5252", "#4fc3f7", "#69f0ae", "#bb86fc", "#ffff00", "#ff9800"]
+    spawns_left = 3
 
     def create_firework(x, y):
+        nonlocal spawns_left
+        spawns_left -= 1
         for _ in range(40):
-            angle = random.uniform(0, 360)
+            angle = math.radians(random.uniform(0, 360))
             speed = random.uniform(2, 7)
-            color = random.choice(colors)
-            dx = speed * math.cos(math.radians(angle))
-            dy = speed * math.sin(math.radians(angle))
-            size = random.randint(2, 5)
-            particle = {'x': x, 'y': y, 'dx': dx, 'dy': dy, 'color': color, 'size': size, 'life': 30}
-            particles.append(particle)
+            pool.spawn(x, y, speed * math.cos(angle), speed * math.sin(angle), 0.1,
+                       random.randint(2, 5), 30, random.choice(colors))
 
     def create_confetti():
+        nonlocal spawns_left
+        spawns_left -= 1
         for _ in range(100):
-            x = random.randint(0, 600)
             y = random.randint(-100, -10)
-            color = random.choice(colors)
             speed = random.uniform(1, 3)
-            confetti.append({'x': x, 'y': y, 'speed': speed, 'color': color, 'size': random.randint(3, 6)})
+            # Lives exactly until it falls past the bottom of the canvas
+            pool.spawn(random.randint(0, 600), y, 0.0, speed, 0.0,
+                       random.randint(3, 6), math.ceil((400 - y) / speed), random.choice(colors))
 
     def animate():
-        canvas.delete("all")
-        for p in particles[:]:
-            p['x'] += p['dx']
-            p['y'] += p['dy']
-            p['dy'] += 0.1
-            p['life'] -= 1
-            if p['life'] > 0:
-                canvas.create_oval(
-                    p['x'] - p['size'], p['y'] - p['size'],
-                    p['x'] + p['size'], p['y'] + p['size'],
-                    fill=p['color'], outline=""
-                )
-            else:
-                particles.remove(p)
-        for c in confetti[:]:
-            c['y'] += c['speed']
-            if c['y'] < 400:
-                canvas.create_oval(
-                    c['x'] - c['size'], c['y'] - c['size'],
-                    c['x'] + c['size'], c['y'] + c['size'],
-                    fill=c['color'], outline=""
-                )
-            else:
-                confetti.remove(c)
-        if particles or confetti:
-            win.after(30, animate)
+        if not canvas.winfo_exists():
+            return
+        started = time.perf_counter()
+        alive = pool.step()
+        elapsed = (time.perf_counter() - started) * 1000
+        # Past the budget, new particles are dropped instead of slowing the frame rate
+        pool.overloaded = elapsed > FIREWORK_FRAME_MS / 2
+        if alive or spawns_left:
+            win.after(max(1, int(FIREWORK_FRAME_MS - elapsed)), animate)
 
     for i in range(2):
         win.after(i * 800, lambda x=150+i*300, y=150: create_firework(x, y))
     win.after(1600, create_confetti)
     win.after(100, animate)
 
+# ==============================
+# GRAPHS
+# ==============================
+GRAPH_RANGES = {"Last 7 Days": 7, "Last 30 Days": 30, "Last 90 Days": 90, "Last 365 Days": 365, "All Time": None}
+
+def graph_buckets(first, last):
+    """Return (unit, bucket start ordinals, labels) covering first..last.
+
+    Spans up to a month are drawn per day, up to about half a year per week
+    (starting on Monday), and anything longer per month.
+    """
+    span = last - first + 1
+    if span <= 31:
+        starts = list(range(first, last + 1))
+        return "day", starts, [date.fromordinal(d).strftime("%m-%d") for d in starts]
+    if span <= 200:
+        starts = list(range(first - date.fromordinal(first).weekday(), last + 1, 7))
+        return "week", starts, [date.fromordinal(d).strftime("%m-%d") for d in starts]
+    d, end = date.fromordinal(first).replace(day=1), date.fromordinal(last)
+    starts = []
+    while d <= end:
+        starts.append(d.toordinal())
+        d = date(d.year + d.month // 12, d.month % 12 + 1, 1)
+    return "month", starts, [date.fromordinal(d).strftime("%b %y") for d in starts]
+
+def nice_ticks(max_val, max_ticks=6):
+    """Axis values from 0 in steps of 1, 2 or 5 x 10^k, at most max_ticks steps."""
+    max_val = max(max_val, 1)
+    magnitude = 1
+    while True:
+        for m in (1, 2, 5):
+            step = m * magnitude
+            steps = math.ceil(max_val / step)
+            if steps <= max_ticks:
+                return list(range(0, steps * step + 1, step))
+        magnitude *= 10
+
+class BarChart:
+    """Grouped bar chart whose canvas items are kept between draws.
+
+    Bars, labels and ticks come from per-kind pools: draw() repositions as
+    many items as it needs and hides the rest, so switching range or filter
+    never rebuilds the canvas.
+    """
+
+    COLORS = ("#4fc3f7", "#69f0ae")
+
+    def __init__(self, canvas, names):
+        self.canvas = canvas
+        self.pools = {}
+        self.used = {}
+        self.title = canvas.create_text(0, 25, fill="#bb86fc", font=("Segoe UI", 13, "bold"))
+        self.legend = []
+        for color, name in zip(self.COLORS, names):
+            self.legend.append((canvas.create_rectangle(0, 0, 0, 0, fill=color, outline=""),
+                                canvas.create_text(0, 0, text=name, fill="#d0d0d0", anchor="w", font=("Segoe UI", 9))))
+
+    def item(self, kind, create):
+        pool = self.pools.setdefault(kind, [])
+        n = self.used.get(kind, 0)
+        if n == len(pool):
+            pool.append(create())
+        self.used[kind] = n + 1
+        return pool[n]
+
+    def draw(self, title, labels, series):
+        c = self.canvas
+        self.used = {}
+        width, height = max(c.winfo_width(), 600), max(c.winfo_height(), 360)
+        left, top, right = 70, 60, width - 170
+        chart_height = height - top - 50
+        bottom = top + chart_height
+
+        c.coords(self.title, width / 2, 25)
+        c.itemconfigure(self.title, text=title)
+        for i, (swatch, text) in enumerate(self.legend):
+            y = 80 + i * 30
+            c.coords(swatch, right + 20, y, right + 40, y + 20)
+            c.coords(text, right + 50, y + 10)
+
+        ticks = nice_ticks(max(max(values, default=0) for values in series))
+        scale = chart_height / ticks[-1]
+        for value in ticks:
+            y = bottom - value * scale
+            line = self.item("tick", lambda: c.create_line(0, 0, 0, 0, fill="#555"))
+            c.coords(line, left - 10, y, left - 5, y)
+            text = self.item("tick_label", lambda: c.create_text(0, 0, fill="#777", font=("Segoe UI", 7), anchor="e"))
+            c.coords(text, left - 20, y)
+            c.itemconfigure(text, text=str(value))
+
+        slot = (right - left) / max(len(labels), 1)
+        bar = max(1.0, slot * 0.75 / len(series))
+        label_every = max(1, math.ceil(len(labels) * 45 / (right - left)))
+        for i, label in enumerate(labels):
+            x = left + i * slot + (slot - bar * len(series)) / 2
+            for k, values in enumerate(series):
+                rect = self.item(k, lambda k=k: c.create_rectangle(0, 0, 0, 0, fill=self.COLORS[k], outline=""))
+                c.coords(rect, x + k * bar, bottom - values[i] * scale, x + (k + 1) * bar, bottom)
+            if i % label_every == 0:
+                text = self.item("label", lambda: c.create_text(0, 0, fill="#a0a0a0", font=("Segoe UI", 8)))
+                c.coords(text, left + (i + 0.5) * slot, bottom + 18)
+                c.itemconfigure(text, text=label)
+
+        for kind, pool in self.pools.items():
+            used = self.used.get(kind, 0)
+            for item in pool[:used]:
+                c.itemconfigure(item, state="normal")
+            for item in pool[used:]:
+                c.itemconfigure(item, state="hidden")
+
+# ==============================
+# SCHEDULER
+# ==============================
+class Scheduler:
+    """Named timers on the Tk event loop.
+
+    Timers live in a heap ordered by wall-clock time and only the earliest
+    one holds a root.after callback. Scheduling a name again replaces its
+    timer; replaced and cancelled entries are dropped lazily from the heap.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self.heap = []
+        self.timers = {}
+        self.seq = 0
+        self.job = None
+        self.job_when = None
+
+    def at(self, name, when, callback):
+        self.seq += 1
+        self.timers[name] = self.seq
+        heapq.heappush(self.heap, (when, self.seq, name, callback))
+        self.arm()
+
+    def after(self, name, delay, callback):
+        self.at(name, time.time() + delay, callback)
+
+    def cancel(self, name):
+        if self.timers.pop(name, None) is not None:
+            self.arm()
+
+    def cancel_all(self):
+        self.timers.clear()
+        self.heap.clear()
+        self.arm()
+
+    def arm(self):
+        heap = self.heap
+        while heap and self.timers.get(heap[0][2]) != heap[0][1]:
+            heapq.heappop(heap)
+        when = heap[0][0] if heap else None
+        if when == self.job_when:
+            return
+        if self.job is not None:
+            self.root.after_cancel(self.job)
+            self.job = None
+        self.job_when = when
+        if when is not None:
+            delay = min(max(0.0, when - time.time()), SCHEDULER_MAX_SLEEP_S)
+            self.job = self.root.after(math.ceil(delay * 1000), self.fire)
+
+    @perf.timed("timers")
+    def fire(self):
+        self.job = None
+        self.job_when = None
+        now = time.time()
+        due = []
+        while self.heap and self.heap[0][0] <= now:
+            when, seq, name, callback = heapq.heappop(self.heap)
+            if self.timers.get(name) == seq:
+                del self.timers[name]
+                due.append(callback)
+        # Arm before running, since callbacks usually schedule themselves again
+        self.arm()
+        for callback in due:
+            try:
+                callback()
+            except Exception as e:
+                print(f"[JobTracker] Scheduled task failed: {e}", file=sys.stderr)
+
+# ==============================
+# UNDO HISTORY
+# ==============================
+class UndoLog:
+    """Bounded undo/redo stacks, persisted as an append-only command log.
+
+    An entry holds the state of one record before and after an edit (None
+    where the record did not exist), or the job type list before and after.
+    Each edit therefore costs the same whatever the size of the data. Each
+    line of undo.jsonl is one command: {"push": entry}, {"undo": 1},
+    {"redo": 1} or {"clear": 1}. Replaying the file rebuilds both stacks.
+    Once the file has 4 * `keep` lines it is rewritten: the current history
+    is pushed again, followed by the undos that take it back to where it was.
+    """
+
+    def __init__(self, path, keep=UNDO_KEEP):
+        self.path = path
+        self.keep = keep
+        self.done = deque(maxlen=keep)
+        self.undone = []
+        self.lines = 0
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        self._apply(json.loads(line))
+                    except (ValueError, TypeError):
+                        break  # torn by a crash mid-append
+                    self.lines += 1
+        except OSError:
+            pass
+
+    def _apply(self, command):
+        if "push" in command:
+            self.done.append(command["push"])
+            self.undone.clear()
+        elif "undo" in command and self.done:
+            self.undone.append(self.done.pop())
+        elif "redo" in command and self.undone:
+            self.done.append(self.undone.pop())
+        elif "clear" in command:
+            self.done.clear()
+            self.undone.clear()
+
+    def record(self, command):
+        self._apply(command)
+        self.lines += 1
+        try:
+            if self.lines >= 4 * self.keep:
+                self.rewrite()
+            else:
+                # Not fsynced: losing the newest step of the history in a
+                # crash is harmless, the data itself is journaled
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(command, ensure_ascii=False) + "\n")
+        except OSError as e:
+            print(f"[JobTracker] Could not save the undo history: {e}", file=sys.stderr)
+
+    def rewrite(self):
+        commands = [{"push": entry} for entry in (*self.done, *reversed(self.undone))]
+        commands += [{"undo": 1}] * len(self.undone)
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            for command in commands:
+                f.write(json.dumps(command, ensure_ascii=False) + "\n")
+        os.replace(tmp, self.path)
+        self.lines = len(commands)
+
+    def push(self, label, **entry):
+        self.record({"push": {"label": label, **entry}})
+
+# ==============================
+# LOCAL API
+# ==============================
+# A read-only JSON API on 127.0.0.1 for dashboards and scripts:
+#   GET /applications?type=&start=&end=&search=&status=&sort=&offset=&limit=
+#   GET /stats?type=&start=&end=
+#   GET /days?type=&start=&end=
+# Requests are answered on server threads from an ApiSnapshot, so they
+# never touch the live store and never wait for the Tk thread to be idle.
+def api_row(record):
+    return record.id, record.company, record.type, record.hr_phone, record.day, record.flags
+
+def api_changes(store, ids):
+    """What ApiServer.changed() takes for the records `ids` of `store`: copies
+    of them (None for deleted ones), or None when `ids` is None (unknown)."""
+    if ids is None:
+        return None
+    changes = {}
+    for app_id in ids:
+        record = store.get(app_id)
+        changes[app_id] = record.copy() if record else None
+    return changes
+
+class ApiSnapshot:
+    """An immutable copy of the data at one version.
+
+    Rows are (id, company, type, hr_phone, day, flags) tuples in date_desc
+    order, and `aggregate` holds the per-day stats counters. Built by
+    ApiServer on a request thread.
+    """
+
+    __slots__ = ("version", "rows", "aggregate")
+
+    def __init__(self, version, rows, days):
+        self.version = version
+        self.rows = tuple(sorted(rows, key=lambda r: (-r[4], r[0])))
+        self.aggregate = StatsAggregate()
+        self.aggregate.days = days
+
+    def query(self, query):
+        """Rows matching `query`, in the same order store.query() returns them."""
+        first, last = query.bounds()
+        rows = self.rows
+        if query.filter_type != "All":
+            rows = [r for r in rows if r[2] == query.filter_type]
+        if first is not None:
+            rows = [r for r in rows if r[4] >= first]
+        if last is not None:
+            rows = [r for r in rows if r[4] <= last]
+        if query.search:
+            rows = [r for r in rows if query.search in r[1].lower()]
+        if query.status != "all":
+            rows = [r for r in rows if not r[5] & Application.INACTIVE]
+        if query.status == "called":
+            rows = [r for r in rows if r[5] & Application.CALLED_HR]
+        elif query.status == "ready":
+            today = date.today().toordinal()
+            rows = [r for r in rows if not r[5] & Application.CALLED_HR and r[4] + followup_days(r[2]) <= today]
+        if query.sort == "date_asc":
+            rows = sorted(rows, key=itemgetter(4))
+        elif query.sort == "company":
+            rows = sorted(rows, key=lambda r: r[1].lower())
+        return rows
+
+def api_query(params):
+    """Query from the request parameters; ValueError names a bad one."""
+    bounds = []
+    for name in ("start", "end"):
+        value = params.get(name)
+        try:
+            bounds.append(date.fromisoformat(value).isoformat() if value else None)
+        except ValueError:
+            raise ValueError(f"{name} must be a YYYY-MM-DD date")
+    status, sort = params.get("status", "active"), params.get("sort", "date_desc")
+    if status not in Query.STATUSES:
+        raise ValueError(f"status must be one of {', '.join(Query.STATUSES)}")
+    if sort not in Query.SORTS:
+        raise ValueError(f"sort must be one of {', '.join(Query.SORTS)}")
+    return Query(params.get("type", "All"), bounds[0], bounds[1], params.get("search", "").lower().strip(),
+                 status, sort)
+
+def api_count(params, name, default):
+    try:
+        value = int(params.get(name, default))
+    except ValueError:
+        value = -1
+    if value < 0:
+        raise ValueError(f"{name} must be a whole number")
+    return value
+
+def api_applications(snapshot, params):
+    rows = snapshot.query(api_query(params))
+    offset = api_count(params, "offset", 0)
+    limit = api_count(params, "limit", len(rows))
+    return {
+        "version": snapshot.version,
+        "total": len(rows),
+        "offset": offset,
+        "applications": [
+            {
+                "id": app_id,
+                "company": company,
+                "type": job_type,
+                "hr_phone": phone,
+                "apply_date": ordinal_to_iso(day),
+                "called_hr": bool(flags & Application.CALLED_HR),
+                "inactive": bool(flags & Application.INACTIVE),
+            }
+            for app_id, company, job_type, phone, day, flags in rows[offset:offset + limit]
+        ],
+    }
+
+def api_searched(snapshot, query):
+    # The stats counters have no company names, so with a search the
+    # counts come from the active rows it matches
+    return snapshot.query(Query(query.filter_type, query.start, query.end, query.search))
+
+def api_stats(snapshot, params):
+    query = api_query(params)
+    today = date.today()
+    week_start = today - timedelta(days=6)
+    month_start = today.replace(day=1)
+    if not query.search:
+        stats = snapshot.aggregate.stats(today.isoformat(), week_start.isoformat(), month_start.isoformat(),
+                                         query.filter_type, query.start, query.end)
+        return {"version": snapshot.version, **stats}
+    rows = api_searched(snapshot, query)
+    stats = {"total_active": len(rows)}
+    for period, since in (("today", today), ("week", week_start), ("month", month_start)):
+        counted = [r for r in rows if since.toordinal() <= r[4] <= today.toordinal()]
+        stats[f"{period}_apps"] = len(counted)
+        stats[f"{period}_calls"] = sum(1 for r in counted if r[5] & Application.CALLED_HR)
+    return {"version": snapshot.version, **stats}
+
+def api_days(snapshot, params):
+    query = api_query(params)
+    if query.search:
+        counts = {}
+        for r in api_searched(snapshot, query):
+            apps, calls = counts.get(r[4], (0, 0))
+            counts[r[4]] = (apps + 1, calls + bool(r[5] & Application.CALLED_HR))
+        days = [{"date": ordinal_to_iso(day), "apps": apps, "calls": calls}
+                for day, (apps, calls) in sorted(counts.items())]
+        return {"version": snapshot.version, "days": days}
+    first, last = query.bounds()
+    days = []
+    for day in sorted(snapshot.aggregate._days_between(first, last)):
+        iso = ordinal_to_iso(day)
+        apps, calls = snapshot.aggregate.count(iso, iso, query.filter_type)
+        if apps:
+            days.append({"date": iso, "apps": apps, "calls": calls})
+    return {"version": snapshot.version, "days": days}
+
+API_ROUTES = {"/applications": api_applications, "/stats": api_stats, "/days": api_days}
+API_HOSTS = ("127.0.0.1", "localhost")
+
+@lru_cache(maxsize=None)
+def api_handler():
+    """The API's request handler class, defined on first use: http.server
+    is slow to import and most runs never serve the API."""
+    from http.server import BaseHTTPRequestHandler
+
+    class ApiHandler(BaseHTTPRequestHandler):
+        server_version = "JobTracker"
+
+        def do_GET(self):
+            api = self.server.api
+            url = urlsplit(self.path)
+            # Only local names, so a web page cannot reach the API by rebinding
+            # its own host name to 127.0.0.1
+            if self.headers.get("Host", "").rsplit(":", 1)[0] not in API_HOSTS:
+                return self.reply(403, {"error": "Forbidden host"})
+            route = API_ROUTES.get(url.path.rstrip("/"))
+            if route is None:
+                return self.reply(404, {"error": f"Unknown path; try {', '.join(API_ROUTES)}"})
+            # Responses depend only on the path, the data version and the date,
+            # so an unchanged version answers a poll without a snapshot
+            etag = api.etag(api.version)
+            if etag in (tag.strip() for tag in self.headers.get("If-None-Match", "").split(",")):
+                return self.reply(304, None, etag)
+            snapshot = api.current()
+            if snapshot is None:
+                return self.reply(503, {"error": "Still loading"}, retry_after=WATCH_INTERVAL_S)
+            try:
+                body = route(snapshot, {k: v[-1] for k, v in parse_qs(url.query).items()})
+            except ValueError as e:
+                return self.reply(400, {"error": str(e)})
+            self.reply(200, body, api.etag(snapshot.version))
+
+        def reply(self, status, body, etag=None, retry_after=None):
+            data = b"" if body is None else json.dumps(body, ensure_ascii=False).encode("utf-8")
+            self.send_response(status)
+            if body is not None:
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(data)))
+            self.send_header("Cache-Control", "no-cache")
+            if etag:
+                self.send_header("ETag", etag)
+            if retry_after:
+                self.send_header("Retry-After", str(retry_after))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args):
+            pass
+
+    return ApiHandler
+
+class ApiServer:
+    """A ThreadingHTTPServer on 127.0.0.1 answering from the newest ApiSnapshot.
+
+    The thread owning the store calls changed() after every mutation with
+    copies of the records it touched (see api_changes()), which bumps
+    `version` and queues them; that costs the same at any data size.
+    Snapshots are built on request threads, one at a time, while others
+    wait up to API_SNAPSHOT_WAIT_S. The first, and any after changed(None),
+    comes from read_committed(), which reads the committed data from disk
+    on the calling thread; later ones apply the queued records to the
+    builder's own rows and stats. While nobody polls, edits cost nothing
+    but the queue.
+    """
+
+    def __init__(self, port, read_committed):
+        self.version = 0
+        self.snapshot = None
+        self.read_committed = read_committed
+        self.cond = threading.Condition()
+        self.building = False
+        self.reload = True
+        # (version, {id: record or None}) not yet in `rows`
+        self.pending = []
+        # Only touched by the request thread building a snapshot
+        self.rows = {}
+        self.aggregate = StatsAggregate()
+        # ETags from an earlier run must not match this run's versions
+        self.run_tag = f"{os.getpid():x}{time.time_ns():x}"
+        from http.server import ThreadingHTTPServer
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", port), api_handler())
+        self.httpd.daemon_threads = True
+        self.httpd.api = self
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    @property
+    def port(self):
+        return self.httpd.server_address[1]
+
+    def etag(self, version):
+        return f'"{self.run_tag}-{version}-{date.today().toordinal()}"'
+
+    def changed(self, changes=None):
+        """Count a new version; `changes` maps ids to records (None if
+        deleted), and None means anything may have changed."""
+        with self.cond:
+            self.version += 1
+            if changes is None:
+                self.reload = True
+                self.pending = []
+            elif changes:
+                self.pending.append((self.version, changes))
+
+    def fresh(self):
+        return self.snapshot is not None and self.snapshot.version == self.version
+
+    def current(self):
+        """The snapshot of the current version, or the newest one if it takes too long; None before the first."""
+        with self.cond:
+            if self.fresh():
+                return self.snapshot
+            if self.building:
+                self.cond.wait_for(self.fresh, API_SNAPSHOT_WAIT_S)
+                return self.snapshot
+            self.building = True
+            version, reload, pending = self.version, self.reload, self.pending
+            self.reload, self.pending = False, []
+        snapshot = None
+        try:
+            snapshot = self.build(version, reload, pending)
+        except Exception as e:
+            print(f"[JobTracker] API could not read the data: {e}", file=sys.stderr)
+            reload = True
+        finally:
+            with self.cond:
+                self.building = False
+                if snapshot is not None:
+                    self.snapshot = snapshot
+                elif reload:
+                    self.reload = True
+                self.cond.notify_all()
+        return self.snapshot
+
+    def build(self, version, reload, pending):
+        if reload:
+            # The committed data includes every change up to `version`,
+            # so the changes queued so far are already in it
+            records = self.read_committed()
+            self.rows = {x.id: api_row(x) for x in records}
+            self.aggregate = StatsAggregate(records)
+            pending = []
+        for _, changes in pending:
+            for app_id, record in changes.items():
+                if record is None:
+                    self.rows.pop(app_id, None)
+                    self.aggregate.remove(app_id)
+                else:
+                    self.rows[app_id] = api_row(record)
+                    self.aggregate.update(record)
+        days = {day: dict(cells) for day, cells in self.aggregate.days.items()}
+        return ApiSnapshot(version, self.rows.values(), days)
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
 # ==============================
 # MAIN APP
 # ==============================
@@ -206,19 +3579,48 @@ class JobTrackerApp:
         self.root.title("Job Application Tracker")
         self.root.geometry("1100x800")
         self.root.configure(bg="#0f0f0f")
-        self.data = load_data()
+        self.store = create_storage()
+        self.previewed = self.store.load_preview(blocking=False)
+        self.load_progress = 0.0
+        journal.on_error = lambda message: self.root.after(0, lambda: messagebox.showerror("Save Error", message))
         self.job_types = load_job_types()
         self.search_var = tk.StringVar()
         self.filter_start_date = tk.StringVar()
         self.filter_end_date = tk.StringVar()
         self.sound_enabled = True
         self.milestones = load_milestones()
+        # The first run skips deadlines before today rather than alerting on
+        # old records, but still alerts on those due today; filled in once
+        # every record is loaded
+        through = self.milestones.get("followups_through") or date.today().toordinal() - 1
+        self.followups = FollowUpQueue((), through)
+
+        self.view_rows = []
+        self.view_offset = 0
+        self.view_query = None
+        self.sort_order = "date_desc"
+        self.search_job = None
+        self.rendered = {}
+        self.rendered_order = []
+        self.selected_id = None
 
         self.running = True
-        self.refresh_thread = None
-        self.milestone_thread = None
+        self.scheduler = Scheduler(root)
+        self.watch_interval = WATCH_INTERVAL_S
+        self.glow_job = None
+        self.api = None
+        if settings["api_port"]:
+            self.start_api()
+        self.history = UndoLog(UNDO_FILE)
 
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
+        self.root.bind("<F12>", lambda e: self.toggle_perf())
+        self.root.bind("<Control-F12>", lambda e: self.dump_perf())
+        self.root.bind("<FocusIn>", lambda e: self.watch_now())
+        for key in ("<Control-z>", "<Control-Z>"):
+            self.root.bind(key, lambda e: self.step_history(undo=True))
+        for key in ("<Control-y>", "<Control-Y>"):
+            self.root.bind(key, lambda e: self.step_history(undo=False))
 
         # Modern dark theme
         style = ttk.Style()
@@ -250,13 +3652,14 @@ class JobTrackerApp:
         ttk.Button(btn_frame, text="📊 Graphs", command=self.show_graphs_window).pack(side="left", padx=4)
         ttk.Button(btn_frame, text="📤 Export", command=self.export_summary).pack(side="left", padx=4)
         ttk.Button(btn_frame, text="🔧 Types", command=self.manage_types).pack(side="left", padx=4)
+        ttk.Button(btn_frame, text="🗄️ Backups", command=self.show_backups_window).pack(side="left", padx=4)
 
         # Search
         search_frame = ttk.Frame(top_frame)
         search_frame.pack(side="left", padx=20)
         ttk.Label(search_frame, text="🔍 Search:", foreground="#bb86fc").pack(side="left")
         ttk.Entry(search_frame, textvariable=self.search_var, width=18).pack(side="left", padx=5)
-        self.search_var.trace("w", lambda *args: self.load_data_view())
+        self.search_var.trace("w", lambda *args: self.schedule_search())
 
         # Date filter
         date_frame = ttk.Frame(top_frame)
@@ -279,6 +3682,9 @@ class JobTrackerApp:
         self.type_menu = ttk.OptionMenu(type_frame, self.filter_type_var, "All", "All")
         self._update_main_filter_menu()
         self.type_menu.pack(side="left", padx=5)
+        self.status_var = tk.StringVar(value="Active")
+        ttk.OptionMenu(type_frame, self.status_var, "Active", *(s.title() for s in Query.STATUSES),
+                       command=lambda _: self.load_data_view()).pack(side="left", padx=5)
 
         # Stats bar
         self.stats_text = tk.Text(root, height=2, bg="#1a1a1a", fg="#a0a0a0", font=("Consolas", 9), wrap="word", relief="flat")
@@ -295,13 +3701,28 @@ class JobTrackerApp:
             width = 50 if col == "ID" else (160 if col == "Company" else 90)
             self.tree.column(col, anchor="center", width=width)
             self.tree.heading(col, text=col)
+        for col in ("Company", "Apply Date"):
+            self.tree.heading(col, command=lambda c=col: self.sort_by(c))
+        self.tree.heading("Apply Date", text="Apply Date ▼")
 
-        vsb = ttk.Scrollbar(tree_frame, orient="vertical", command=self.tree.yview)
+        # Virtual list: the tree only holds the visible window of view_rows,
+        # and vsb scrolls that window over the whole filtered result
+        self.vsb = ttk.Scrollbar(tree_frame, orient="vertical", command=self.on_vsb)
         hsb = ttk.Scrollbar(tree_frame, orient="horizontal", command=self.tree.xview)
-        self.tree.configure(yscrollcommand=vsb.set, xscrollcommand=hsb.set)
+        self.tree.configure(xscrollcommand=hsb.set)
         self.tree.pack(side="left", fill="both", expand=True)
-        vsb.pack(side="right", fill="y")
+        self.vsb.pack(side="right", fill="y")
         hsb.pack(side="bottom", fill="x")
+        self.tree.tag_configure("ready", background="#253525")
+        self.tree.bind("<Configure>", lambda e: self.render_view())
+        self.tree.bind("<<TreeviewSelect>>", self.on_tree_select)
+        self.tree.bind("<MouseWheel>", self.on_mousewheel)
+        self.tree.bind("<Button-4>", self.on_mousewheel)
+        self.tree.bind("<Button-5>", self.on_mousewheel)
+        self.tree.bind("<Up>", lambda e: self.move_selection(-1))
+        self.tree.bind("<Down>", lambda e: self.move_selection(1))
+        self.tree.bind("<Prior>", lambda e: self.move_selection(-self.page_size()))
+        self.tree.bind("<Next>", lambda e: self.move_selection(self.page_size()))
 
         # Context menu
         self.context_menu = tk.Menu(root, tearoff=0, bg="#2a2a2a", fg="#ffffff", font=("Segoe UI", 10))
@@ -313,8 +3734,91 @@ class JobTrackerApp:
         self.tree.bind("<Button-3>", self.show_context_menu)
 
         self.load_data_view()
-        self.start_auto_refresh()
-        self.start_milestone_checker()
+        self.schedule_rollover()
+        self.start_load()
+
+    def start_load(self):
+        # Only the first open of a SQLite database can find data_lock busy;
+        # it is retried rather than waited for
+        if not self.previewed:
+            self.previewed = self.store.load_preview(blocking=False)
+            if not self.previewed:
+                self.scheduler.after("preview", LOCK_RETRY_MS / 1000, self.start_load)
+                return
+            self.load_data_view()
+        self.start_background_load()
+
+    def start_background_load(self):
+        query = self.current_query()
+
+        def progress(done, total):
+            self.root.after(0, self.show_load_progress, done / max(total, 1))
+
+        def run():
+            try:
+                state = self.store.load_rest(progress, query)
+            except Exception as e:
+                self.root.after(0, messagebox.showerror, "Data Load Error", str(e))
+                return
+            self.root.after(0, self.finish_load, state)
+        threading.Thread(target=run, daemon=True).start()
+
+    def show_load_progress(self, fraction):
+        if self.store.loading:
+            self.load_progress = fraction
+            self.update_stats_display(self.last_stats)
+
+    def finish_load(self, state):
+        for warning in self.store.finish_load(state):
+            messagebox.showwarning("Data Load Error", warning)
+        self.load_progress = None
+        if self.api is not None:
+            self.api.changed()
+        self.rebuild_followups()
+        self.load_data_view()
+        self.check_followups()
+        self.scheduler.after("milestone", 0, self.check_daily_milestone)
+        self.scheduler.after("watch", WATCH_INTERVAL_S, self.watch_data)
+        self.scheduler.after("backup", BACKUP_INTERVAL_S, self.take_backup)
+
+    def take_backup(self):
+        # A no-op when nothing changed since the last backup point
+        self.store.backup()
+        self.scheduler.after("backup", BACKUP_INTERVAL_S, self.take_backup)
+
+    def rebuild_followups(self):
+        # Deadlines up to `through` were handed out in an earlier session, so
+        # only records applied within the longest window can still come due
+        through = self.followups.through
+        recent = self.store.query(Query(start=ordinal_to_iso(max(1, through - longest_followup() + 1))))
+        self.followups = FollowUpQueue(recent, through)
+
+    def watch_data(self):
+        # Picks up what the import/bench commands or a second window wrote
+        try:
+            changed = self.store.sync()
+        except Exception as e:
+            print(f"[JobTracker] Could not check for outside changes: {e}", file=sys.stderr)
+            changed = []
+        if changed is None or changed:
+            self.rebuild_followups()
+            self.data_changed(changed)
+            self.watch_interval = WATCH_INTERVAL_S
+        else:
+            self.watch_interval = min(2 * self.watch_interval, WATCH_MAX_INTERVAL_S)
+        self.scheduler.after("watch", self.watch_interval, self.watch_data)
+
+    def watch_now(self):
+        # Coming back from another window is when its changes matter
+        if not self.store.loading and self.watch_interval > WATCH_INTERVAL_S:
+            self.watch_interval = WATCH_INTERVAL_S
+            self.scheduler.after("watch", 0, self.watch_data)
+
+    def loaded(self):
+        if self.store.loading:
+            messagebox.showinfo("Loading", "Still loading your applications, try again in a moment.")
+            return False
+        return True
 
     def _update_main_filter_menu(self):
         menu = self.type_menu["menu"]
@@ -323,14 +3827,47 @@ class JobTrackerApp:
         for t in self.job_types:
             menu.add_command(label=t, command=lambda x=t: self._set_filter_and_refresh(x))
 
+    def schedule_search(self):
+        if self.search_job is not None:
+            self.root.after_cancel(self.search_job)
+        self.search_job = self.root.after(settings["search_debounce_ms"], self.run_search)
+
+    def run_search(self):
+        self.search_job = None
+        self.load_data_view()
+
     def _set_filter_and_refresh(self, value):
         self.filter_type_var.set(value)
         self.load_data_view()
 
+    def toggle_perf(self):
+        perf.enabled = not perf.enabled
+        self.load_data_view()
+
+    def dump_perf(self, quiet=False):
+        path = os.path.join(APP_DIR, f"perf-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json")
+        try:
+            perf.dump(path)
+        except Exception as e:
+            if not quiet:
+                messagebox.showerror("Trace Error", str(e))
+            return
+        if quiet:
+            print(f"[JobTracker] Wrote {path}", file=sys.stderr)
+        else:
+            messagebox.showinfo("Trace Saved", f"Timings written to:\n{path}")
+
     def on_closing(self):
         self.running = False
-        time.sleep(0.1)
-        release_lock()
+        self.scheduler.cancel_all()
+        for job in (self.glow_job, self.search_job):
+            if job is not None:
+                self.root.after_cancel(job)
+        if perf.enabled:
+            self.dump_perf(quiet=True)
+        if self.api is not None:
+            self.api.close()
+        self.store.close()
         self.root.destroy()
 
     def animate_glow(self):
@@ -340,7 +3877,7 @@ class JobTrackerApp:
         color = f"#{intensity:02x}{intensity:02x}ff"
         self.header.config(fg=color)
         self.glow_phase += 0.1
-        self.root.after(100, self.animate_glow)
+        self.glow_job = self.root.after(100, self.animate_glow)
 
     def pick_date(self, var):
         cal_win = tk.Toplevel(self.root)
@@ -377,172 +3914,350 @@ class JobTrackerApp:
 
     def manage_types(self):
         dialog = ManageTypesDialog(self.root, self.job_types)
-        if dialog.result is not None:
-            save_job_types(dialog.result)
-            self.job_types = load_job_types()
-            self._update_main_filter_menu()
-            self.filter_type_var.set("All")
-            self.load_data_view()
+        if dialog.result is not None and dialog.result != self.job_types:
+            before = list(self.job_types)
+            if self.set_job_types(dialog.result):
+                self.history.push("change job types", types=[before, dialog.result])
+
+    def set_job_types(self, types):
+        saved = save_job_types(types)
+        self.job_types = load_job_types()
+        self._update_main_filter_menu()
+        self.filter_type_var.set("All")
+        self.load_data_view()
+        return saved
 
     def add_application(self):
+        if not self.loaded():
+            return
         dialog = ApplicationDialog(self.root, lambda: self.job_types)
         if dialog.result:
-            company, job_type, hr_phone = dialog.result
-            new_entry = {
-                "id": max([item["id"] for item in self.data], default=0) + 1,
-                "company": company,
-                "type": job_type,
-                "hr_phone": hr_phone,
-                "apply_date": datetime.today().date().isoformat(),
-                "called_hr": False,
-                "inactive": False
-            }
-            self.data.append(new_entry)
-            save_data(self.data)
-            self.load_data_view()
-            self.check_daily_milestone()
+            self.add_new(*dialog.result, datetime.today().toordinal())
+
+    def add_new(self, company, job_type, hr_phone, day):
+        # Another window or an import may be committing; try again once it
+        # is done instead of freezing the window until then
+        app_id = self.store.allocate_id(blocking=False)
+        if app_id is None:
+            self.root.after(LOCK_RETRY_MS, self.add_new, company, job_type, hr_phone, day)
+            return
+        new_entry = Application(app_id, company, job_type, hr_phone, day)
+        if self.persist(self.store.add, new_entry):
+            self.followups.update(new_entry)
+            self.remember(f"add {company}", None, new_entry)
+        self.data_changed((app_id,))
 
     def edit_application(self):
+        if not self.loaded():
+            return
         selected = self.tree.selection()
         if not selected:
             messagebox.showwarning("No Selection", "Select an entry to edit.")
             return
         app_id = self.tree.item(selected[0])["values"][0]
-        item = next((x for x in self.data if x["id"] == app_id), None)
+        item = self.store.get(app_id)
         if not item:
             return
         dialog = ApplicationDialog(self.root, lambda: self.job_types, initial=item)
         if dialog.result:
             company, job_type, hr_phone = dialog.result
-            item.update({"company": company, "type": job_type, "hr_phone": hr_phone})
-            save_data(self.data)
-            self.load_data_view()
+            before = item.to_dict()
+            item.company, item.type, item.hr_phone = sys.intern(company), sys.intern(job_type), hr_phone
+            if self.persist(self.store.update, item):
+                self.followups.update(item)
+                self.remember(f"edit {company}", before, item)
+            self.data_changed((app_id,))
 
     def delete_application(self):
+        if not self.loaded():
+            return
         selected = self.tree.selection()
         if not selected:
             messagebox.showwarning("No Selection", "Select an entry to delete.")
             return
         app_id = self.tree.item(selected[0])["values"][0]
-        self.data = [x for x in self.data if x["id"] != app_id]
-        save_data(self.data)
-        self.load_data_view()
+        item = self.store.get(app_id)
+        if self.persist(self.store.delete, app_id):
+            self.followups.remove(app_id)
+            if item:
+                self.remember(f"delete {item.company}", item.to_dict(), None)
+        self.data_changed((app_id,))
 
     def mark_called_hr(self):
+        if not self.loaded():
+            return
         selected = self.tree.selection()
         if not selected:
             messagebox.showwarning("No Selection", "Select an entry.")
             return
         app_id = self.tree.item(selected[0])["values"][0]
-        for item in self.data:
-            if item["id"] == app_id:
-                item["called_hr"] = True
-                break
-        save_data(self.data)
-        self.load_data_view()
+        item = self.store.get(app_id)
+        if item is not None and item.called_hr:
+            # Already marked: nothing to save, and no edit to undo
+            return
+        if item:
+            before = item.to_dict()
+            item.called_hr = True
+            if self.persist(self.store.update, item):
+                self.followups.update(item)
+                self.remember(f"mark {item.company} called", before, item)
+        self.data_changed((app_id,))
 
     def mark_inactive(self):
+        if not self.loaded():
+            return
         selected = self.tree.selection()
         if not selected:
             messagebox.showwarning("No Selection", "Select an entry.")
             return
         app_id = self.tree.item(selected[0])["values"][0]
-        for item in self.data:
-            if item["id"] == app_id:
-                item["inactive"] = True
-                break
-        save_data(self.data)
+        item = self.store.get(app_id)
+        if item is not None and item.inactive:
+            # Already marked: nothing to save, and no edit to undo
+            return
+        if item:
+            before = item.to_dict()
+            item.inactive = True
+            if self.persist(self.store.update, item):
+                self.followups.update(item)
+                self.remember(f"mark {item.company} inactive", before, item)
+        self.data_changed((app_id,))
+
+    def remember(self, label, before, after):
+        """Push an edit of one record; `before` is its to_dict() beforehand, `after` the record or None."""
+        app_id = after.id if after else before["id"]
+        self.history.push(label, id=app_id, before=before, after=after.to_dict() if after else None)
+
+    def step_history(self, undo):
+        """Undo (or redo) the newest edit, unless that record or the job types changed since."""
+        if not self.loaded():
+            return
+        stack = self.history.done if undo else self.history.undone
+        if not stack:
+            self.root.bell()
+            return
+        entry = stack[-1]
+        verb = "undo" if undo else "redo"
+        if "types" in entry:
+            before, after = entry["types"]
+            expected, target = (after, before) if undo else (before, after)
+            if expected != self.job_types:
+                self.history_conflict(verb, entry)
+                return
+            if self.set_job_types(target):
+                self.history.record({verb: 1})
+            return
+        expected, target = (entry["after"], entry["before"]) if undo else (entry["before"], entry["after"])
+        app_id = entry["id"]
+        if expected is not None:
+            # Its month may not be loaded since a restart
+            day = expected["apply_date"]
+            current = next((x for x in self.store.query(Query(start=day, end=day, status="all")) if x.id == app_id), None)
+        else:
+            current = self.store.get(app_id)
+        if (current.to_dict() if current else None) != expected:
+            self.history_conflict(verb, entry)
+            return
+        # The history only moves once the store has taken the change
+        if target is None:
+            if self.persist(self.store.delete, app_id):
+                self.history.record({verb: 1})
+                self.followups.remove(app_id)
+        else:
+            record = Application.from_dict(target)
+            if self.persist(self.store.update if current else self.store.add, record):
+                self.history.record({verb: 1})
+                self.followups.update(record)
+        self.data_changed((app_id,))
+
+    def history_conflict(self, verb, entry):
+        # Changed by another window, a script or a restore; stepping over
+        # that change would silently revert it
+        self.history.record({"clear": 1})
+        messagebox.showwarning(f"Cannot {verb.capitalize()}",
+                               f"Cannot {verb} \"{entry['label']}\": it was changed elsewhere since. "
+                               "The undo history has been cleared.")
+
+    def data_changed(self, ids=()):
+        """Refresh after the records `ids` changed; None when it is not known which."""
+        if self.api is not None:
+            self.api.changed(api_changes(self.store, ids))
         self.load_data_view()
+        # Coalesced, so a burst of edits costs one milestone check
+        self.scheduler.after("milestone", 0, self.check_daily_milestone)
+        self.schedule_followup()
 
-    def show_context_menu(self, event):
-        self.context_menu.post(event.x_root, event.y_root)
+    def start_api(self):
+        # Snapshots are built on the request threads, from the files and
+        # the records data_changed() hands over
+        try:
+            self.api = ApiServer(settings["api_port"], self.store.read_committed)
+        except OSError as e:
+            messagebox.showwarning("API Not Started", f"Could not listen on port {settings['api_port']}:\n{e}")
 
-    def load_data_view(self):
-        for row in self.tree.get_children():
-            self.tree.delete(row)
-
-        filter_type = self.filter_type_var.get()
-        start_date = self.filter_start_date.get().strip()
-        end_date = self.filter_end_date.get().strip()
-        search_term = self.search_var.get().lower().strip()
-        active_data = [x for x in self.data if not x.get("inactive", False)]
-
-        if filter_type != "All":
-            active_data = [x for x in active_data if x["type"] == filter_type]
-        if start_date and end_date:
-            try:
-                start_dt = datetime.fromisoformat(start_date).date()
-                end_dt = datetime.fromisoformat(end_date).date()
-                active_data = [x for x in active_data if start_dt <= datetime.fromisoformat(x["apply_date"]).date() <= end_dt]
-            except ValueError:
-                pass
-        elif start_date:
-            try:
-                start_dt = datetime.fromisoformat(start_date).date()
-                active_data = [x for x in active_data if datetime.fromisoformat(x["apply_date"]).date() >= start_dt]
-            except ValueError:
-                pass
-        elif end_date:
+    def persist(self, method, *args):
+        """Call a store method; False (after telling the user) if it raised."""
+        try:
+            method(*args)
+        except Exception as e:
+            messagebox.showerror("Save Error", str(e))
+            return False
+        return True
+
+    def current_query(self):
+        bounds = []
+        for var in (self.filter_start_date, self.filter_end_date):
+            value = var.get().strip()
             try:
-                end_dt = datetime.fromisoformat(end_date).date()
-                active_data = [x for x in active_data if datetime.fromisoformat(x["apply_date"]).date() <= end_dt]
+                bounds.append(datetime.fromisoformat(value).date().isoformat() if value else None)
             except ValueError:
-                pass
-        if search_term:
-            active_data = [x for x in active_data if search_term in x["company"].lower()]
+                bounds.append(None)
+        return Query(self.filter_type_var.get(), bounds[0], bounds[1], self.search_var.get().lower().strip(),
+                     self.status_var.get().lower(), self.sort_order)
+
+    def sort_by(self, column):
+        if column == "Company":
+            self.sort_order = "company"
+        else:
+            self.sort_order = "date_asc" if self.sort_order == "date_desc" else "date_desc"
+        arrows = {"company": ("Company ▲", "Apply Date"), "date_desc": ("Company", "Apply Date ▼"),
+                  "date_asc": ("Company", "Apply Date ▲")}[self.sort_order]
+        self.tree.heading("Company", text=arrows[0])
+        self.tree.heading("Apply Date", text=arrows[1])
+        self.load_data_view()
 
-        active_data.sort(key=lambda x: x["apply_date"], reverse=True)
+    def show_context_menu(self, event):
+        self.context_menu.post(event.x_root, event.y_root)
+
+    @perf.timed("view")
+    def load_data_view(self):
+        if not self.previewed:
+            return
+        query = self.current_query()
+        if query != self.view_query:
+            self.view_query = query
+            self.view_offset = 0
+        with perf.section("query"):
+            self.view_rows = self.store.query(query)
+        self.render_view()
 
         today = datetime.today().date()
-        ready_to_call = False
-        for item in active_data:
-            apply_dt = datetime.fromisoformat(item["apply_date"]).date()
-            days_diff = (today - apply_dt).days
-            days_left = max(0, 7 - days_diff)
-            if days_left == 0 and not item["called_hr"]:
-                ready_to_call = True
-            status = "✅ Called" if item["called_hr"] else ("⏳ Ready" if days_left == 0 else f"{days_left}d")
-            tags = ("ready",) if (days_left == 0 and not item["called_hr"]) else ()
-            self.tree.insert("", "end", values=(
-                item["id"],
-                item["company"],
-                item["type"],
-                item["hr_phone"] or "—",
-                item["apply_date"],
-                days_left,
-                status
-            ), tags=tags)
+        week_start = (today - timedelta(days=6)).isoformat()
+        month_start = today.replace(day=1).isoformat()
+        with perf.section("stats"):
+            stats = self.store.stats(today.isoformat(), week_start, month_start, query)
+        self.update_stats_display(stats)
 
-        self.tree.tag_configure("ready", background="#253525")
+    def page_size(self):
+        height = self.tree.winfo_height()
+        if height <= 1:
+            return 40  # not mapped yet
+        row_height = int(ttk.Style().lookup("Treeview", "rowheight") or 20)
+        return max(1, (height - 25) // row_height)
+
+    @perf.timed("render")
+    def render_view(self):
+        page = self.page_size()
+        total = len(self.view_rows)
+        self.view_offset = max(0, min(self.view_offset, total - page))
+        window = self.view_rows[self.view_offset:self.view_offset + page + VIEW_OVERSCAN]
 
-        if ready_to_call and self.sound_enabled:
-            def play_alert():
-                print('\a', end='', flush=True)
-            threading.Thread(target=play_alert, daemon=True).start()
+        # Keyed diff against what is on screen: only new, changed, moved or
+        # vanished rows cost a Tk call
+        today = datetime.today().toordinal()
+        new_ids = [str(item.id) for item in window]
+        keep = set(new_ids)
+        stale = [iid for iid in self.rendered_order if iid not in keep]
+        if stale:
+            self.tree.delete(*stale)
+            for iid in stale:
+                del self.rendered[iid]
+        order = [iid for iid in self.rendered_order if iid in keep]
+        for index, (iid, item) in enumerate(zip(new_ids, window)):
+            row = self.row_values(item, today)
+            if iid not in self.rendered:
+                self.tree.insert("", index, iid=iid, values=row[0], tags=row[1])
+                order.insert(index, iid)
+            else:
+                if self.rendered[iid] != row:
+                    self.tree.item(iid, values=row[0], tags=row[1])
+                if order[index] != iid:
+                    self.tree.move(iid, "", index)
+                    order.remove(iid)
+                    order.insert(index, iid)
+            self.rendered[iid] = row
+        self.rendered_order = order
 
-        today_str = today.isoformat()
-        week_dates = set(get_week_dates())
-        month_dates = {datetime(today.year, today.month, day).date().isoformat() for day in range(1, today.day + 1)}
+        if self.selected_id is not None and str(self.selected_id) in self.rendered:
+            if self.tree.selection() != (str(self.selected_id),):
+                self.tree.selection_set(str(self.selected_id))
+                self.tree.focus(str(self.selected_id))
+        self.tree.yview_moveto(0)
 
-        today_apps = sum(1 for x in active_data if x["apply_date"] == today_str)
-        week_apps = sum(1 for x in active_data if x["apply_date"] in week_dates)
-        month_apps = sum(1 for x in active_data if x["apply_date"] in month_dates)
-        today_calls = sum(1 for x in active_data if x["apply_date"] == today_str and x.get("called_hr", False))
-        week_calls = sum(1 for x in active_data if x["apply_date"] in week_dates and x.get("called_hr", False))
-        month_calls = sum(1 for x in active_data if x["apply_date"] in month_dates and x.get("called_hr", False))
+        if total:
+            self.vsb.set(self.view_offset / total, min(1.0, (self.view_offset + page) / total))
+        else:
+            self.vsb.set(0.0, 1.0)
 
-        stats = {
-            "today_apps": today_apps,
-            "week_apps": week_apps,
-            "month_apps": month_apps,
-            "today_calls": today_calls,
-            "week_calls": week_calls,
-            "month_calls": month_calls,
-            "total_active": len(active_data)
-        }
-        self.update_stats_display(stats)
+    def row_values(self, item, today):
+        days_left = max(0, followup_days(item.type) - (today - item.day))
+        if item.inactive:
+            status, tags = "⏹️ Inactive", ()
+        else:
+            status = "✅ Called" if item.called_hr else ("⏳ Ready" if days_left == 0 else f"{days_left}d")
+            tags = ("ready",) if (days_left == 0 and not item.called_hr) else ()
+        return (
+            item.id,
+            item.company,
+            item.type,
+            item.hr_phone or "—",
+            item.apply_date,
+            days_left,
+            status
+        ), tags
+
+    def scroll_to(self, offset):
+        offset = max(0, min(offset, len(self.view_rows) - self.page_size()))
+        if offset != self.view_offset:
+            self.view_offset = offset
+            self.render_view()
+
+    def on_vsb(self, action, *args):
+        if action == "moveto":
+            self.scroll_to(int(float(args[0]) * len(self.view_rows)))
+        elif action == "scroll":
+            step = self.page_size() if args[1] == "pages" else 1
+            self.scroll_to(self.view_offset + int(args[0]) * step)
+
+    def on_mousewheel(self, event):
+        if event.num == 4 or event.delta > 0:
+            self.scroll_to(self.view_offset - 3)
+        else:
+            self.scroll_to(self.view_offset + 3)
+        return "break"
+
+    def on_tree_select(self, event):
+        selected = self.tree.selection()
+        if selected:
+            self.selected_id = int(selected[0])
+
+    def move_selection(self, delta):
+        if not self.view_rows:
+            return "break"
+        selected = self.tree.selection()
+        index = self.view_offset + self.tree.index(selected[0]) if selected else self.view_offset - 1
+        index = max(0, min(index + delta, len(self.view_rows) - 1))
+        page = self.page_size()
+        if index < self.view_offset:
+            self.view_offset = index
+        elif index >= self.view_offset + page:
+            self.view_offset = index - page + 1
+        self.selected_id = self.view_rows[index].id
+        self.render_view()
+        return "break"
 
     def update_stats_display(self, stats):
+        self.last_stats = stats
         self.stats_text.config(state="normal")
         self.stats_text.delete(1.0, tk.END)
         text = (
@@ -551,129 +4266,176 @@ class JobTrackerApp:
             f"🗓️ Month: {stats['month_apps']} apps | {stats['month_calls']} calls   "
             f"💼 Active: {stats['total_active']}"
         )
+        if self.store.loading:
+            text += f"   ⏳ Loading {self.load_progress:.0%}…"
+        if perf.enabled:
+            text += f"\n⏱ ms last/avg/p95: {perf.overlay() or 'no samples yet'}"
+        self.stats_text.config(height=3 if perf.enabled else 2)
         self.stats_text.insert(tk.END, text)
         self.stats_text.config(state="disabled")
 
-    def start_auto_refresh(self):
-        def refresh():
-            while self.running:
-                time.sleep(60)
-                if self.running:
-                    self.root.after(0, self.load_data_view)
-        self.refresh_thread = threading.Thread(target=refresh, daemon=True)
-        self.refresh_thread.start()
-
-    def start_milestone_checker(self):
-        def checker():
-            while self.running:
-                if self.running:
-                    self.check_daily_milestone()
-                time.sleep(60)
-        self.milestone_thread = threading.Thread(target=checker, daemon=True)
-        self.milestone_thread.start()
+    def schedule_rollover(self):
+        # "Days Left", "Ready" and the today/week/month stats only change
+        # when the date does, so the view needs no periodic refresh
+        midnight = datetime.combine(date.today() + timedelta(days=1), datetime.min.time())
+        self.scheduler.at("rollover", midnight.timestamp(), self.on_rollover)
+
+    def on_rollover(self):
+        self.load_data_view()
+        self.schedule_rollover()
+
+    def schedule_followup(self):
+        due = self.followups.next_due()
+        if due is None:
+            self.scheduler.cancel("followup")
+            return
+        when = datetime.combine(date.fromordinal(due), datetime.min.time())
+        self.scheduler.at("followup", when.timestamp(), self.check_followups)
 
+    def check_followups(self):
+        ready = self.followups.pop_due(date.today().toordinal())
+        if self.followups.through != self.milestones.get("followups_through"):
+            self.milestones["followups_through"] = self.followups.through
+            save_milestones(self.milestones)
+        if ready and self.sound_enabled:
+            print('\a', end='', flush=True)
+        self.schedule_followup()
+
+    @perf.timed("milestone")
     def check_daily_milestone(self):
         today = datetime.today().date().isoformat()
-        count = sum(1 for x in self.data if x["apply_date"] == today and not x.get("inactive", False))
+        count = self.store.day_counts([today])[0][0]
         if count >= 10 and self.milestones["last_daily"] != today:
             self.milestones["last_daily"] = today
             save_milestones(self.milestones)
             msg = f"You submitted {count} applications today! Keep it up!"
-            self.root.after(0, lambda: show_fireworks("🎉 Daily Milestone!", msg))
+            show_fireworks("🎉 Daily Milestone!", msg)
 
     def export_summary(self):
-        filter_type = self.filter_type_var.get()
-        start_date = self.filter_start_date.get().strip()
-        end_date = self.filter_end_date.get().strip()
-        active_data = [x for x in self.data if not x.get("inactive", False)]
-        if filter_type != "All":
-            active_data = [x for x in active_data if x["type"] == filter_type]
-        if start_date and end_date:
-            try:
-                start_dt = datetime.fromisoformat(start_date).date()
-                end_dt = datetime.fromisoformat(end_date).date()
-                active_data = [x for x in active_data if start_dt <= datetime.fromisoformat(x["apply_date"]).date() <= end_dt]
-            except ValueError:
-                pass
+        if not self.loaded():
+            return
+        win = tk.Toplevel(self.root)
+        win.title("📤 Export")
+        win.geometry("340x170")
+        win.configure(bg="#1a1a1a")
+        win.transient(self.root)
 
-        today = datetime.today().date()
-        html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="utf-8">
-            <title>Job Application Summary</title>
-            <style>
-                body {{ font-family: Segoe UI, sans-serif; background: #0f0f0f; color: #d0d0d0; padding: 20px; }}
-                h1 {{ color: #4fc3f7; text-align: center; }}
-                .stats {{ background: #1a1a1a; padding: 15px; border-radius: 8px; margin: 20px 0; }}
-                table {{ width: 100%; border-collapse: collapse; margin-top: 20px; }}
-                th, td {{ padding: 10px; text-align: center; border-bottom: 1px solid #333; }}
-                tr.ready {{ background: #253525; }}
-                .status-called {{ color: #69f0ae; }}
-                .status-ready {{ color: #ffcc00; }}
-            </style>
-        </head>
-        <body>
-            <h1>Job Application Summary</h1>
-            <div class="stats">
-                <strong>Filter:</strong> Type={filter_type}, Date={start_date or 'Any'} to {end_date or 'Any'}<br>
-                <strong>Total Active Applications:</strong> {len(active_data)}
-            </div>
-            <table>
-                <thead>
-                    <tr>
-                        <th>Company</th>
-                        <th>Type</th>
-                        <th>Apply Date</th>
-                        <th>Status</th>
-                    </tr>
-                </thead>
-                <tbody>
-        """
-        for item in sorted(active_data, key=lambda x: x["apply_date"], reverse=True):
-            apply_dt = datetime.fromisoformat(item["apply_date"]).date()
-            days_diff = (today - apply_dt).days
-            days_left = max(0, 7 - days_diff)
-            if item.get("called_hr", False):
-                status = '<span class="status-called">✅ Called</span>'
-                css_class = ""
-            elif days_left == 0:
-                status = '<span class="status-ready">⏳ Ready</span>'
-                css_class = "ready"
+        fmt_var = tk.StringVar(value="HTML")
+        fmt_frame = ttk.Frame(win)
+        fmt_frame.pack(pady=12)
+        for name in EXPORTERS:
+            ttk.Radiobutton(fmt_frame, text=name, value=name, variable=fmt_var).pack(side="left", padx=8)
+
+        progress = ttk.Progressbar(win, length=280, mode="determinate")
+        progress.pack(pady=6)
+        status = tk.Label(win, text="", bg="#1a1a1a", fg="#a0a0a0", font=("Segoe UI", 9))
+        status.pack()
+
+        def update(done, total):
+            if win.winfo_exists():
+                progress["value"] = 100 * done / max(total, 1)
+                status.config(text=f"{done} / {total}")
+
+        def finished(path, total):
+            if win.winfo_exists():
+                win.destroy()
+            if path.endswith(".html"):
+                import webbrowser
+                webbrowser.open("file://" + os.path.abspath(path))
             else:
-                status = f"{days_left}d"
-                css_class = ""
-
-            html += f"""
-                <tr class="{css_class}">
-                    <td>{item["company"]}</td>
-                    <td>{item["type"]}</td>
-                    <td>{item["apply_date"]}</td>
-                    <td>{status}</td>
-                </tr>
-            """
-        html += """
-                </tbody>
-            </table>
-            <p style="text-align: center; margin-top: 30px; color: #777;">
-                Generated on """ + datetime.now().strftime("%Y-%m-%d %H:%M") + """
-            </p>
-        </body>
-        </html>
-        """
-        summary_path = os.path.join(APP_DIR, "summary.html")
-        with open(summary_path, "w", encoding="utf-8") as f:
-            f.write(html)
-        webbrowser.open("file://" + os.path.abspath(summary_path))
+                messagebox.showinfo("Export Complete", f"Wrote {total} applications to\n{path}")
+
+        def failed(error):
+            if win.winfo_exists():
+                win.destroy()
+            messagebox.showerror("Export Error", error)
+
+        def start():
+            # Same query as the table; the rows are written on a worker thread,
+            # from copies, since edits change the stored records in place
+            query = self.current_query()
+            rows = [x.copy() for x in self.store.query(query)]
+            filename, writer = EXPORTERS[fmt_var.get()]
+            path = os.path.join(APP_DIR, filename)
+            export_btn.config(state="disabled")
+            total = len(rows)
+
+            def run():
+                try:
+                    with perf.section("export"):
+                        out = writer(path, rows, total, query, lambda d, t: self.root.after(0, update, d, t))
+                except Exception as e:
+                    self.root.after(0, failed, str(e))
+                else:
+                    self.root.after(0, finished, out, total)
+
+            threading.Thread(target=run, daemon=True).start()
+
+        export_btn = ttk.Button(win, text="Export", command=start)
+        export_btn.pack(pady=8)
+
+    def show_backups_window(self):
+        if not self.loaded():
+            return
+        win = tk.Toplevel(self.root)
+        win.title("🗄️ Backups")
+        win.geometry("420x340")
+        win.configure(bg="#1a1a1a")
+        win.transient(self.root)
+
+        entries = list(reversed(backups.list()))
+        listbox = tk.Listbox(win, bg="#2a2a2a", fg="#d0d0d0", font=("Consolas", 9), selectmode=tk.SINGLE)
+        for e in entries:
+            listbox.insert(tk.END, f"{e['ts'].replace('T', ' ')}  {e['kind']:<5}  {e['count']} records")
+        listbox.pack(pady=8, padx=15, fill="both", expand=True)
+
+        def restore():
+            sel = listbox.curselection()
+            if not sel:
+                messagebox.showwarning("No Selection", "Select a backup to restore.", parent=win)
+                return
+            entry = entries[sel[0]]
+            if not messagebox.askyesno("Confirm", f"Replace current data with the backup from {entry['ts'].replace('T', ' ')}?", parent=win):
+                return
+            try:
+                records = [Application.from_dict(x) for x in backups.restore(entry)]
+            except Exception as e:
+                messagebox.showerror("Restore Error", str(e), parent=win)
+                return
+            commit(records)
+
+        def commit(records):
+            # Replacing everything holds data_lock (and waits for this
+            # window's queued writes); while another window or an import
+            # is writing, try again shortly rather than freeze
+            if data_lock.busy() or not journal.idle():
+                self.root.after(LOCK_RETRY_MS, commit, records)
+                return
+            if not self.persist(self.store.replace_all, records):
+                self.data_changed(None)
+                return
+            # Undoing single edits across a wholesale replacement would mix the two
+            self.history.record({"clear": 1})
+            if win.winfo_exists():
+                win.destroy()
+            self.followups = FollowUpQueue(records, self.followups.through)
+            self.data_changed(None)
+
+        btn_frame = ttk.Frame(win)
+        btn_frame.pack(pady=10)
+        ttk.Button(btn_frame, text="Restore", command=restore, width=10).pack(side="left", padx=6)
+        ttk.Button(btn_frame, text="Close", command=win.destroy, width=10).pack(side="left", padx=6)
 
     def show_graphs_window(self):
+        if not self.loaded():
+            return
         graph_win = tk.Toplevel(self.root)
         graph_win.title("📊 Application Statistics")
         graph_win.geometry("850x550")
         graph_win.configure(bg="#0f0f0f")
 
         graph_filter_var = tk.StringVar(value="All")
+        range_var = tk.StringVar(value="Last 7 Days")
 
         filter_frame = ttk.Frame(graph_win)
         filter_frame.pack(pady=10)
@@ -683,62 +4445,34 @@ class JobTrackerApp:
         menu_container = ttk.Frame(filter_frame)
         menu_container.pack(side="left", padx=5)
 
+        ttk.OptionMenu(filter_frame, range_var, range_var.get(), *GRAPH_RANGES,
+                       command=lambda _: draw_graph()).pack(side="left", padx=5)
+
         canvas = tk.Canvas(graph_win, bg="#1a1a1a", highlightthickness=0)
         canvas.pack(fill="both", expand=True, padx=20, pady=10)
+        chart = BarChart(canvas, ("Applications", "HR Calls"))
 
         def update_graph_filter_menu():
             for widget in menu_container.winfo_children():
                 widget.destroy()
             options = ["All"] + self.job_types
-            menu = ttk.OptionMenu(menu_container, graph_filter_var, "All", *options)
+            menu = ttk.OptionMenu(menu_container, graph_filter_var, "All", *options, command=lambda _: draw_graph())
             menu.pack()
 
-        def draw_graph(filter_type):
-            canvas.delete("all")
-            active_data = [x for x in self.data if not x.get("inactive", False)]
-            if filter_type != "All":
-                active_data = [x for x in active_data if x["type"] == filter_type]
-
-            dates = get_week_dates()
-            app_counts = []
-            call_counts = []
-            for d in dates:
-                apps = sum(1 for x in active_data if x["apply_date"] == d)
-                calls = sum(1 for x in active_data if x["apply_date"] == d and x.get("called_hr", False))
-                app_counts.append(apps)
-                call_counts.append(calls)
-
-            canvas.create_text(425, 25, text=f"Last 7 Days: Applications & HR Calls ({filter_type})", fill="#bb86fc", font=("Segoe UI", 13, "bold"))
-
-            max_val = max(max(app_counts, default=0), max(call_counts, default=0), 1)
-            chart_height = 260
-            bar_width = 35
-            spacing = 12
-            start_x = 70
-            start_y = 60
-
-            for i, (apps, calls) in enumerate(zip(app_counts, call_counts)):
-                x = start_x + i * (bar_width + spacing)
-                app_h = (apps / max_val) * chart_height
-                call_h = (calls / max_val) * chart_height
-                canvas.create_rectangle(x, start_y + chart_height - app_h, x + bar_width//2, start_y + chart_height, fill="#4fc3f7", outline="")
-                canvas.create_rectangle(x + bar_width//2, start_y + chart_height - call_h, x + bar_width, start_y + chart_height, fill="#69f0ae", outline="")
-                date_label = dates[i][5:]
-                canvas.create_text(x + bar_width//2, start_y + chart_height + 18, text=date_label, fill="#a0a0a0", font=("Segoe UI", 8))
-
-            canvas.create_rectangle(680, 80, 700, 100, fill="#4fc3f7", outline="")
-            canvas.create_text(710, 90, text="Applications", fill="#d0d0d0", anchor="w", font=("Segoe UI", 9))
-            canvas.create_rectangle(680, 110, 700, 130, fill="#69f0ae", outline="")
-            canvas.create_text(710, 120, text="HR Calls", fill="#d0d0d0", anchor="w", font=("Segoe UI", 9))
-
-            for i in range(0, max_val + 1):
-                y = start_y + chart_height - (i / max_val) * chart_height
-                canvas.create_line(60, y, 65, y, fill="#555")
-                canvas.create_text(50, y, text=str(i), fill="#777", font=("Segoe UI", 7), anchor="e")
+        def draw_graph():
+            filter_type, range_name = graph_filter_var.get(), range_var.get()
+            last = date.today().toordinal()
+            days = GRAPH_RANGES[range_name]
+            first = last - days + 1 if days else min(self.store.first_day() or last, last)
+            unit, starts, labels = graph_buckets(first, last)
+            app_counts, call_counts = self.store.bucket_counts(starts, last, filter_type)
+            per = "" if unit == "day" else f", per {unit}"
+            chart.draw(f"{range_name}: Applications & HR Calls ({filter_type}{per})", labels, (app_counts, call_counts))
 
         update_graph_filter_menu()
-        ttk.Button(filter_frame, text="Refresh", command=lambda: draw_graph(graph_filter_var.get())).pack(side="left", padx=10)
-        draw_graph("All")
+        ttk.Button(filter_frame, text="Refresh", command=draw_graph).pack(side="left", padx=10)
+        canvas.bind("<Configure>", lambda e: draw_graph())
+        draw_graph()
 
 
 # ==============================
@@ -761,12 +4495,12 @@ class ApplicationDialog:
             tk.Label(self.win, text=label, bg="#1a1a1a", fg="#bb86fc", font=("Segoe UI", 10)).grid(row=i, column=0, sticky="w", padx=15, pady=10)
             if key == "type":
                 job_types = job_types_getter()
-                var = tk.StringVar(value=initial["type"] if initial else (job_types[0] if job_types else ""))
+                var = tk.StringVar(value=initial.type if initial else (job_types[0] if job_types else ""))
                 combo = ttk.Combobox(self.win, textvariable=var, state="readonly", values=job_types, width=25)
                 combo.grid(row=i, column=1, padx=10, pady=10, sticky="ew")
                 self.widgets[key] = var
             else:
-                val = initial[key] if initial else ""
+                val = {"company": initial.company, "phone": initial.hr_phone}[key] if initial else ""
                 entry = ttk.Entry(self.win, font=("Segoe UI", 10), width=25)
                 entry.insert(0, val)
                 entry.grid(row=i, column=1, padx=10, pady=10, sticky="ew")
@@ -856,10 +4590,377 @@ class ManageTypesDialog:
         self.win.destroy()
 
 
+# ==============================
+# BENCHMARKS
+# ==============================
+BENCH_COMPANIES = ("Acme", "Globex", "Initech", "Umbrella", "Stark", "Wayne", "Hooli", "Vandelay",
+                   "Soylent", "Cyberdyne", "Tyrell", "Wonka", "Nakatomi", "Oscorp", "Aperture", "Pied Piper")
+BENCH_SUFFIXES = ("", " Labs", " Systems", " Health", " Digital", " Logistics", " Bank", " Media")
+BENCH_TYPES = ("Software Engineer", "Data Analyst", "Product Manager", "DevOps Engineer")
+# Differences under this many seconds never count as regressions
+BENCH_NOISE_FLOOR = 0.005
+
+def generate_applications(n, seed=42, today=None, years=2):
+    """Return n seeded, plausible Applications with ids 1..n.
+
+    Dates cover the last `years` years, denser towards today and mostly on
+    weekdays. Job types and company names are skewed, so a few of each
+    dominate. Older records are more likely to have been called or
+    closed.
+    """
+    rng = random.Random(seed)
+    today = today or date.today().toordinal()
+    span = 365 * years
+    companies = [sys.intern(f"{c}{s}") for c in BENCH_COMPANIES for s in BENCH_SUFFIXES]
+    weights = [1 / (i + 1) for i in range(len(BENCH_COMPANIES)) for _ in BENCH_SUFFIXES]
+    records = []
+    for app_id in range(1, n + 1):
+        day = today - int(rng.triangular(0, span, 0))
+        while date.fromordinal(day).weekday() >= 5 and rng.random() < 0.75:
+            day = today - int(rng.triangular(0, span, 0))
+        age = today - day
+        phone = f"+1 555 {rng.randrange(1000, 10000)}" if rng.random() < 0.4 else ""
+        record = Application(app_id, rng.choices(companies, weights)[0], rng.choices(BENCH_TYPES, (5, 3, 2, 1))[0],
+                             phone, day)
+        record.called_hr = age > 7 and rng.random() < 0.35
+        record.inactive = rng.random() < min(0.6, age / span)
+        records.append(record)
+    return records
+
+def best_of(repeat, fn):
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def bench_data(records, repeat, out_dir):
+    """Time the storage, query, export and aggregate paths without Tk."""
+    results = {}
+    today = date.today()
+    iso_today = today.isoformat()
+    store = open_storage()
+    results["save"] = best_of(repeat, lambda: store.replace_all(records))
+    store.close()
+
+    results["load"] = best_of(repeat, lambda: open_storage().close())
+    if settings["storage"] == "json":
+        # The same load parsing the JSON shards instead of their binary cache
+        cached, settings["shard_cache"] = settings["shard_cache"], False
+        try:
+            results["load_json"] = best_of(repeat, lambda: open_storage().close())
+        finally:
+            settings["shard_cache"] = cached
+    month_ago = (today - timedelta(days=30)).isoformat()
+    # A fresh start that only needs the last month, as a date filter would
+    results["load_recent"] = best_of(repeat, lambda: open_storage(Query(start=month_ago)).close())
+    store = open_storage()
+
+    queries = {
+        "query_all": Query(),
+        "query_type": Query(BENCH_TYPES[1]),
+        "query_range": Query(start=month_ago, end=iso_today),
+        "query_search": Query(search="labs"),
+        "query_ready": Query(status="ready"),
+    }
+    for name, query in queries.items():
+        results[name] = best_of(repeat, lambda: store.query(query))
+    week_start = (today - timedelta(days=6)).isoformat()
+    month_start = today.replace(day=1).isoformat()
+    results["stats"] = best_of(repeat, lambda: store.stats(iso_today, week_start, month_start))
+    if isinstance(store, JsonStorage):
+        # One edit folded into the data files, as every JOURNAL_COMPACT_THRESHOLD edits are
+        latest = store.query(Query(status="all"))[0]
+
+        def compact():
+            store.update(latest)
+            store.compact(background=False)
+        results["compact"] = best_of(repeat, compact)
+
+    for fmt, (filename, writer) in EXPORTERS.items():
+        path = os.path.join(out_dir, filename)
+        results[f"export_{fmt.lower()}"] = best_of(
+            repeat, lambda: writer(path, iter(store.query()), len(records), Query(), lambda done, total: None))
+
+    def graph():
+        last = today.toordinal()
+        unit, starts, labels = graph_buckets(store.first_day() or last, last)
+        store.bucket_counts(starts, last)
+    results["graph_buckets"] = best_of(repeat, graph)
+    results["milestone"] = best_of(repeat, lambda: store.day_counts([iso_today]))
+    store.close()
+    return results
+
+def bench_ui(repeat):
+    """Time the Tk paths on a withdrawn root; returns {} when there is no display."""
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        print(f"[JobTracker] Skipping UI benchmarks: {e}", file=sys.stderr)
+        return {}
+    root.withdraw()
+    results = {}
+    try:
+        started = time.perf_counter()
+        app = JobTrackerApp(root)
+        root.update_idletasks()
+        results["ui_startup"] = time.perf_counter() - started
+
+        def refresh():
+            app.load_data_view()
+            root.update_idletasks()
+        results["ui_view"] = best_of(repeat, refresh)
+        app.search_var.set("labs")
+        results["ui_view_search"] = best_of(repeat, refresh)
+        app.search_var.set("")
+
+        canvas = tk.Canvas(root, width=850, height=450)
+        chart = BarChart(canvas, ("Applications", "HR Calls"))
+
+        def graph():
+            last = date.today().toordinal()
+            unit, starts, labels = graph_buckets(app.store.first_day() or last, last)
+            chart.draw("All Time", labels, app.store.bucket_counts(starts, last))
+            root.update_idletasks()
+        results["ui_graph"] = best_of(repeat, graph)
+
+        # Already celebrated, so the check runs without opening the fireworks
+        app.milestones["last_daily"] = date.today().isoformat()
+        results["ui_milestone"] = best_of(repeat, app.check_daily_milestone)
+        app.scheduler.cancel_all()
+        app.store.close()
+    finally:
+        journal.on_error = None
+        root.destroy()
+    return results
+
+def check_regressions(results, baseline, threshold):
+    """Return a line per timing that got more than `threshold` times slower than the baseline."""
+    regressions = []
+    for size, timings in results.items():
+        for name, elapsed in timings.items():
+            before = baseline.get(size, {}).get(name)
+            if before is not None and elapsed > before * threshold and elapsed - before > BENCH_NOISE_FLOOR:
+                regressions.append(f"{size} {name}: {before * 1000:.1f} ms -> {elapsed * 1000:.1f} ms")
+    return regressions
+
+def run_benchmarks(sizes, seed=42, repeat=3, output=None, baseline=None, threshold=1.25):
+    """Benchmark each dataset size in a scratch data directory and report JSON timings."""
+    import platform
+    import tempfile
+
+    global journal, backups, data_lock
+    real = (APP_DIR, journal, backups, data_lock)
+    report = {
+        "seed": seed,
+        "repeat": repeat,
+        "storage": settings["storage"],
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "numpy": numpy() is not None,
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "results": {},
+    }
+    try:
+        for size in sizes:
+            with tempfile.TemporaryDirectory(prefix="jobtracker-bench-") as scratch:
+                set_app_dir(scratch)
+                data_lock = DataLock(LOCK_FILE, GENERATION_FILE)
+                journal, backups = Journal(JOURNAL_FILE), BackupStore(BACKUP_DIR)
+                save_job_types(list(BENCH_TYPES))
+                started = time.perf_counter()
+                records = generate_applications(size, seed)
+                print(f"Generated {size:,} applications in {time.perf_counter() - started:.2f}s", file=sys.stderr)
+                timings = bench_data(records, repeat, scratch)
+                timings.update(bench_ui(repeat))
+                journal.flush()
+            report["results"][str(size)] = timings
+            for name, elapsed in timings.items():
+                print(f"{size:>9,}  {name:<16} {elapsed * 1000:10.1f} ms")
+    finally:
+        set_app_dir(real[0])
+        journal, backups, data_lock = real[1], real[2], real[3]
+
+    if output:
+        write_json_atomic(output, report, indent=2)
+        print(f"Wrote {output}")
+    if baseline:
+        with open(baseline, "r", encoding="utf-8") as f:
+            regressions = check_regressions(report["results"], json.load(f).get("results", {}), threshold)
+        if regressions:
+            print(f"Regressions against {baseline} (threshold x{threshold}):")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print(f"No regressions against {baseline} (threshold x{threshold})")
+    return 0
+
+# ==============================
+# COMMAND LINE
+# ==============================
+TRUE_VALUES = {"1", "true", "yes", "y"}
+
+def read_import_rows(path, fmt):
+    """Yield (line number, row dict) from a CSV or JSONL file, one row at a time."""
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        if fmt == "csv":
+            reader = csv.DictReader(f)
+            for row in reader:
+                yield reader.line_num, {(k or "").strip().lower(): v for k, v in row.items()}
+        else:
+            for line_num, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    row = json.loads(line)
+                except ValueError:
+                    row = None
+                yield line_num, row
+
+def parse_import_row(row, job_types, today):
+    """Validate one imported row and return it as an Application without an id."""
+    if not isinstance(row, dict):
+        raise ValueError("not a JSON object")
+    company = str(row.get("company") or "").strip()
+    job_type = str(row.get("type") or "").strip()
+    if not company:
+        raise ValueError("missing company")
+    if not job_type:
+        raise ValueError("missing type")
+    if job_types is not None and job_type not in job_types:
+        raise ValueError(f"unknown job type {job_type!r}")
+    apply_date = str(row.get("apply_date") or "").strip() or today
+    apply_date = datetime.fromisoformat(apply_date).date().isoformat()
+
+    def flag(value):
+        return value if isinstance(value, bool) else str(value or "").strip().lower() in TRUE_VALUES
+
+    return Application.create(0, company, job_type, str(row.get("hr_phone") or "").strip(), apply_date,
+                              flag(row.get("called_hr")), flag(row.get("inactive")))
+
+def import_applications(path, fmt=None, add_types=False):
+    """Bulk-import a CSV/JSONL file: validate, dedupe, assign ids and commit, a chunk at a time."""
+    if fmt is None:
+        fmt = "jsonl" if path.lower().endswith((".jsonl", ".ndjson")) else "csv"
+    started = time.perf_counter()
+    store = open_storage()
+    job_types = load_job_types()
+    known = set(job_types)
+    new_types = []
+    today = datetime.today().date().isoformat()
+    # Hashes rather than tuples keep the dedupe set small for large files
+    seen = {hash((x.company.lower(), x.type, x.day)) for x in store.all()}
+    counts = {"read": 0, "duplicates": 0, "rejected": 0}
+
+    def accepted():
+        for line_num, row in read_import_rows(path, fmt):
+            counts["read"] += 1
+            try:
+                record = parse_import_row(row, None if add_types else known, today)
+            except (ValueError, TypeError) as e:
+                counts["rejected"] += 1
+                if counts["rejected"] <= 10:
+                    print(f"{path}:{line_num}: skipped, {e}", file=sys.stderr)
+                continue
+            key = hash((record.company.lower(), record.type, record.day))
+            if key in seen:
+                counts["duplicates"] += 1
+                continue
+            seen.add(key)
+            if record.type not in known:
+                known.add(record.type)
+                new_types.append(record.type)
+            yield record
+
+    imported = 0
+    rows = accepted()
+    try:
+        # Each chunk is parsed before any lock is taken, so data_lock is
+        # only held to reserve its ids and to commit it, and the file is
+        # never held in memory whole
+        while True:
+            chunk = list(islice(rows, IMPORT_CHUNK_RECORDS))
+            if not chunk:
+                break
+            first = store.reserve_ids(len(chunk))
+            for app_id, record in enumerate(chunk, first):
+                record.id = app_id
+            imported += store.add_many(chunk)
+    finally:
+        store.close()
+    if new_types:
+        save_job_types(job_types + new_types)
+
+    elapsed = time.perf_counter() - started
+    print(f"Read {counts['read']} rows in {elapsed:.2f}s ({counts['read'] / max(elapsed, 1e-9):,.0f} rows/s)")
+    print(f"Imported {imported}, skipped {counts['duplicates']} duplicates and {counts['rejected']} invalid rows")
+    if new_types:
+        print(f"Added job types: {', '.join(new_types)}")
+    return 0
+
+def serve_api(port):
+    """Serve the read-only API without the window, picking up changes other processes commit."""
+    # Snapshots are read from the files, so only what sync() replays into
+    # needs to be loaded here
+    store = open_storage(Query(start=date.today().isoformat()))
+    try:
+        api = ApiServer(port, store.read_committed)
+    except OSError as e:
+        print(f"Could not listen on port {port}: {e}", file=sys.stderr)
+        return 1
+    print(f"Serving http://127.0.0.1:{api.port}/applications (Ctrl+C to stop)", file=sys.stderr)
+    try:
+        while True:
+            time.sleep(WATCH_INTERVAL_S)
+            changed = store.sync()
+            if changed is None or changed:
+                api.changed(api_changes(store, changed))
+    except KeyboardInterrupt:
+        return 0
+    finally:
+        api.close()
+        store.close()
+
+def main_cli(argv):
+    parser = argparse.ArgumentParser(prog="Jobapp.py", description="Job Application Tracker command line tools.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    p = commands.add_parser("import", help="bulk-import applications from a CSV or JSONL file")
+    p.add_argument("file")
+    p.add_argument("--format", choices=("csv", "jsonl"), help="input format (default: from the file extension)")
+    p.add_argument("--add-types", action="store_true",
+                   help="add unknown job types to job_types.json instead of skipping those rows")
+    p = commands.add_parser("bench", help="time the hot paths on seeded synthetic data")
+    p.add_argument("--sizes", default="1000,10000,100000",
+                   help="comma-separated dataset sizes (default: %(default)s)")
+    p.add_argument("--seed", type=int, default=42)
+    p.add_argument("--repeat", type=int, default=3, help="runs per timing; the best is kept")
+    p.add_argument("--storage", choices=("json", "sqlite"), help="backend to benchmark (default: from settings)")
+    p.add_argument("--output", help="write the results as JSON to this file")
+    p.add_argument("--baseline", help="earlier --output file to compare against; exits 1 on a regression")
+    p.add_argument("--threshold", type=float, default=1.25,
+                   help="slowdown factor that counts as a regression (default: %(default)s)")
+    p = commands.add_parser("serve", help="serve the read-only JSON API without opening the window")
+    p.add_argument("--port", type=int, default=settings["api_port"] or 8765,
+                   help="port on 127.0.0.1 (default: the api_port setting, or 8765)")
+    args = parser.parse_args(argv)
+    if args.command == "import":
+        return import_applications(args.file, args.format, args.add_types)
+    if args.command == "bench":
+        if args.storage:
+            settings["storage"] = args.storage
+        sizes = [int(x) for x in args.sizes.split(",") if x.strip()]
+        return run_benchmarks(sizes, args.seed, args.repeat, args.output, args.baseline, args.threshold)
+    if args.command == "serve":
+        return serve_api(args.port)
+
 # ==============================
 # Run
 # ==============================
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        sys.exit(main_cli(sys.argv[1:]))
     try:
         root = tk.Tk()
         app = JobTrackerApp(root)
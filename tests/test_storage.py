@@ -0,0 +1,235 @@
+"""Storage consistency checks: both backends, the stats aggregate, the shard cache and backups.
+
+Every test runs in its own data directory, with the module-level journal,
+backups and data lock pointed at it the way run_benchmarks() does.
+"""
+import os
+import random
+import sys
+from datetime import date, timedelta
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import Jobapp as J  # noqa: E402
+
+BACKENDS = ("json", "sqlite")
+
+
+def use_dir(path, storage):
+    J.set_app_dir(str(path))
+    J.data_lock = J.DataLock(J.LOCK_FILE, J.GENERATION_FILE)
+    J.journal = J.Journal(J.JOURNAL_FILE)
+    J.backups = J.BackupStore(J.BACKUP_DIR)
+    J.settings.clear()
+    J.settings.update(J.DEFAULT_SETTINGS, storage=storage)
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    real = (J.APP_DIR, J.journal, J.backups, J.data_lock, dict(J.settings))
+    yield tmp_path
+    J.journal.flush()
+    J.set_app_dir(real[0])
+    J.journal, J.backups, J.data_lock = real[1], real[2], real[3]
+    J.settings.clear()
+    J.settings.update(real[4])
+
+
+def open_store():
+    store = J.create_storage()
+    store.load()
+    if store.loading:
+        store.finish_load(store.load_rest(None))
+    return store
+
+
+def rows(records):
+    return sorted((x.id, x.company, x.type, x.hr_phone, x.day, x.flags) for x in records)
+
+
+def mutate(store, model, rng, steps):
+    """Random adds, edits, deletes and moves to another month, mirrored in `model`."""
+    types = J.BENCH_TYPES
+    today = date.today().toordinal()
+    for _ in range(steps):
+        kind = rng.random()
+        if kind < 0.35 or not model:
+            record = J.Application(store.allocate_id(), f"Co {rng.randrange(50)}", rng.choice(types),
+                                   "", today - rng.randrange(700))
+            store.add(record)
+        elif kind < 0.55:
+            store.delete(model.pop(rng.choice(sorted(model))).id)
+            continue
+        else:
+            record = store.get(rng.choice(sorted(model)))
+            if kind < 0.7:
+                record.company, record.type = f"Co {rng.randrange(50)}", rng.choice(types)
+            elif kind < 0.85:
+                record.called_hr = not record.called_hr
+                record.inactive = rng.random() < 0.3
+            else:
+                # Into another month, so the record changes shard
+                record.day = today - rng.randrange(700)
+            store.update(record)
+        model[record.id] = record
+
+
+@pytest.mark.parametrize("storage", BACKENDS)
+def test_random_mutations_keep_aggregate_and_disk_consistent(data_dir, storage):
+    use_dir(data_dir, storage)
+    rng = random.Random(7)
+    store = open_store()
+    store.add_many(J.generate_applications(800, seed=3))
+    model = {x.id: x for x in store.all()}
+    for _ in range(5):
+        mutate(store, model, rng, 120)
+        assert rows(store.all()) == rows(model.values())
+        assert store.aggregate.verify(store.all())
+    store.close()
+
+    reopened = open_store()
+    assert rows(reopened.all()) == rows(model.values())
+    assert reopened.aggregate.verify(reopened.all())
+    reopened.close()
+
+
+def test_lazy_json_load_matches_full_load(data_dir):
+    use_dir(data_dir, "json")
+    store = open_store()
+    store.add_many(J.generate_applications(2000, seed=5, years=3))
+    mutate(store, {x.id: x for x in store.all()}, random.Random(1), 150)
+    expected = rows(store.all())
+    store.close()
+
+    recent = J.create_storage()
+    recent.load(J.Query(start=(date.today() - timedelta(days=20)).isoformat()))
+    assert recent.unloaded
+    assert recent.aggregate.verify(recent.all())
+    assert rows(recent.all()) == expected
+    recent.close()
+
+
+QUERIES = [
+    J.Query(),
+    J.Query(status="all"),
+    J.Query(status="called", sort="date_asc"),
+    J.Query(status="ready"),
+    J.Query("Data Analyst"),
+    J.Query(search="labs", sort="company"),
+    J.Query("Software Engineer", start=(date.today() - timedelta(days=90)).isoformat(),
+            end=(date.today() - timedelta(days=10)).isoformat(), status="all"),
+]
+
+
+def test_json_and_sqlite_queries_agree(data_dir):
+    results = {}
+    for storage in BACKENDS:
+        use_dir(data_dir / storage, storage)
+        store = open_store()
+        store.add_many(J.generate_applications(1500, seed=11))
+        mutate(store, {x.id: x for x in store.all()}, random.Random(2), 200)
+        today = date.today()
+        week_start = (today - timedelta(days=6)).isoformat()
+        results[storage] = (
+            [[x.id for x in store.query(q)] for q in QUERIES],
+            [store.stats(today.isoformat(), week_start, today.replace(day=1).isoformat(), q) for q in QUERIES],
+            rows(store.all()),
+        )
+        store.close()
+    assert results["json"] == results["sqlite"]
+
+
+def test_shard_cache_round_trips_and_rejects_stale_or_damaged_files(data_dir):
+    use_dir(data_dir, "json")
+    records = J.generate_applications(500, seed=9, years=1)
+    records[0].extra = {"note": "héllo", "tags": [1, 2]}
+    records[1].company = "Ünïcode 公司"
+    store = open_store()
+    store.replace_all(records)
+    store.close()
+
+    months = sorted(J.load_manifest()["shards"])
+    for month in months:
+        cached = J.read_shard_cache(month)
+        assert cached is not None
+        from_json = [J.Application.from_dict(x) for x in J.read_shard(month)]
+        assert rows(cached) == rows(from_json)
+        assert [x.extra for x in cached] == [x.extra for x in from_json]
+
+    month = months[0]
+    path = J.shard_cache_path(month)
+    with open(path, "r+b") as f:
+        f.seek(-1, os.SEEK_END)
+        last = f.read(1)
+        f.seek(-1, os.SEEK_END)
+        f.write(bytes([last[0] ^ 1]))
+    assert J.read_shard_cache(month) is None
+    # Read from the JSON instead, which writes the cache again
+    J.read_shard_records(month)
+    assert J.read_shard_cache(month) is not None
+
+    stat = os.stat(J.shard_path(month))
+    os.utime(J.shard_path(month), ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    assert J.read_shard_cache(month) is None
+
+
+@pytest.mark.parametrize("storage", BACKENDS)
+def test_a_short_session_still_leaves_a_backup(data_dir, storage):
+    use_dir(data_dir, storage)
+    store = open_store()
+    for i in range(150):
+        store.add(J.Application(store.allocate_id(), f"Co {i}", "Remote", "", date.today().toordinal()))
+    store.close()
+    points = J.backups.list()
+    assert points
+    assert sorted(x["id"] for x in J.backups.restore(points[-1])) == list(range(1, 151))
+
+
+OTHER_PROCESS = """
+import sys
+sys.path.insert(0, sys.argv[1])
+import Jobapp as J
+J.set_app_dir(sys.argv[2])
+J.data_lock = J.DataLock(J.LOCK_FILE, J.GENERATION_FILE)
+J.journal = J.Journal(J.JOURNAL_FILE)
+J.backups = J.BackupStore(J.BACKUP_DIR)
+J.settings.update(storage="json")
+store = J.create_storage()
+store.load()
+if store.loading:
+    store.finish_load(store.load_rest(None))
+record = store.get(int(sys.argv[3]))
+record.company = "Renamed elsewhere"
+store.update(record)
+store.compact(background=False)
+store.close()
+"""
+
+
+def test_edit_from_another_process_survives_a_local_compaction(data_dir):
+    import subprocess
+    use_dir(data_dir, "json")
+    records = J.generate_applications(300, seed=4, years=1)
+    store = open_store()
+    store.replace_all(records)
+    target = records[0]
+    # Another record of the same month, whose shard the local edit rewrites
+    neighbour = next(x for x in records[1:] if J.month_of(x.day) == J.month_of(target.day))
+
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    subprocess.run([sys.executable, "-c", OTHER_PROCESS, root, str(data_dir), str(target.id)], check=True)
+
+    store.sync(blocking=True)
+    # The rewritten month is unloaded; queries read it back
+    store.ensure()
+    assert store.get(target.id).company == "Renamed elsewhere"
+    record = store.get(neighbour.id)
+    record.company = "Renamed here"
+    store.update(record)
+    store.compact(background=False)
+    store.close()
+
+    on_disk = {x["id"]: x["company"] for x in J.read_shard(J.month_of(target.day))}
+    assert on_disk[target.id] == "Renamed elsewhere"
+    assert on_disk[neighbour.id] == "Renamed here"